@@ -2,10 +2,11 @@
 import tkinter as tk
 import customtkinter as ctk
 from tkinter import messagebox
-import requests
+import httpx
 import json
 from database.models import DatabaseManager, User, SubscriptionPlan
 from datetime import datetime
+from utils.http_client import http_client
 
 class LoginWindow(ctk.CTk):
     def __init__(self, login_callback, app_name="ScrapeOn", web_api_url=None):
@@ -201,7 +202,7 @@ class LoginWindow(ctk.CTk):
             self.configure(cursor="wait")
             
             # Make API request to web backend
-            response = requests.post(
+            response = http_client.post(
                 f"{self.web_api_url}/auth/login",
                 json={"username": username, "password": password},
                 timeout=10
@@ -227,12 +228,12 @@ class LoginWindow(ctk.CTk):
             else:
                 messagebox.showerror("Login Failed", f"Server error: {response.status_code}")
                 
-        except requests.ConnectionError:
+        except httpx.ConnectError:
             messagebox.showerror(
                 "Connection Error", 
                 "Cannot connect to web server. Please check your internet connection or try local login."
             )
-        except requests.Timeout:
+        except httpx.TimeoutException:
             messagebox.showerror("Timeout", "Login request timed out. Please try again.")
         except Exception as e:
             messagebox.showerror("Error", f"Login failed: {str(e)}")
@@ -0,0 +1,249 @@
+# benchmark_extraction.py - Measure contact extraction speed over saved pages
+
+import os
+import re
+import sys
+import tempfile
+import time
+
+from config.app_config import app_config
+from scrapers.contact_extractors import (EMAIL_PATTERN, PHONE_PATTERN, clean_phone, extract_emails, extract_phones,
+                                         is_valid_phone, page_text)
+from utils.email_rules import EmailRules, email_rules
+
+# The seven overlapping patterns phone extraction used before the combined PHONE_PATTERN
+LEGACY_PHONE_PATTERNS = [
+    r'\+1[\s\-\.]?\(?([0-9]{3})\)?[\s\-\.]?([0-9]{3})[\s\-\.]?([0-9]{4})\b',
+    r'\(?([0-9]{3})\)?[\s\-\.]?([0-9]{3})[\s\-\.]?([0-9]{4})\b',
+    r'\+[1-9]\d{1,14}\b',
+    r'\b\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}\b',
+    r'\(\d{3}\)[\s\-]?\d{3}[\s\-]?\d{4}',
+    r'\+91[\s\-]?\d{10}',
+    r'\b[6-9]\d{9}\b'
+]
+LEGACY_INVALID_NUMBERS = [
+    '0000000000', '1111111111', '2222222222', '3333333333',
+    '4444444444', '5555555555', '6666666666', '7777777777',
+    '8888888888', '9999999999', '1234567890', '0123456789',
+    '9876543210'
+]
+
+
+def sample_page(index):
+    """Synthetic page shaped like a typical small-business site"""
+    tracking_blob = ",".join(f'{{"id":{4155550100 + i * 7},"sku":"{9000000000 + i}"}}' for i in range(400))
+    image = "A" * 20000
+    return f"""<!DOCTYPE html>
+<html><head><title>Acme Plumbing {index}</title>
+<style>.hero{{background:url(data:image/png;base64,{image})}} .x{{width:1024px}}</style>
+<script>window.__STATE__ = [{tracking_blob}]; var build = "2024.01.1234567890";</script>
+</head><body>
+<nav><a href="/about">About</a> <a href="/contact">Contact us</a></nav>
+<svg viewBox="0 0 24 24"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2z"/></svg>
+<img src="data:image/png;base64,{image}" alt="Acme logo"> <img src="/img/team@2x.jpg" alt="team@2x.jpg">
+<main><h1>Acme Plumbing</h1><p>Family run since 1987. Call <b>(415) 555-{index % 9000 + 1000:04d}</b> today.</p></main>
+<footer><a href="mailto:office{index}@acmeplumbing.com?subject=Quote">Email us</a>
+<a href="tel:+14155550199">Call</a> <span>Order #4155550123 shipped</span></footer>
+</body></html>"""
+
+
+def load_corpus(paths):
+    """Pages from saved HTML files, else the page cache, else synthetic samples"""
+    pages = []
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, files in os.walk(path):
+                pages.extend(os.path.join(directory, name) for name in sorted(files)
+                             if name.lower().endswith(('.html', '.htm')))
+        else:
+            pages.append(path)
+    if pages:
+        corpus = []
+        for path in pages:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                corpus.append(f.read())
+        return corpus, f"{len(corpus)} saved pages"
+
+    if app_config.PAGE_CACHE_ENABLED:
+        from utils.page_cache import page_cache
+        corpus = []
+        for (url,) in page_cache.connect().execute("SELECT url FROM pages").fetchall():
+            entry = page_cache.lookup(url)
+            body = page_cache.read_body(entry) if entry else None
+            if body:
+                corpus.append(body)
+        if corpus:
+            return corpus, f"{len(corpus)} pages from the page cache"
+
+    return [sample_page(i) for i in range(50)], "50 synthetic pages"
+
+
+def time_pages(corpus, func, repeat=3):
+    """Best-of-repeat seconds per page for func over the corpus"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in corpus:
+            func(html)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / max(len(corpus), 1)
+
+
+def run_extraction(corpus):
+    """Bytes scanned, time per page and contacts found for the current settings"""
+    scanned = sum(len(page_text(html).text) for html in corpus)
+    per_page = time_pages(corpus, lambda html: (extract_emails(html), extract_phones(html)))
+    emails = sum(len(extract_emails(html)) for html in corpus)
+    phones = sum(len(extract_phones(html)) for html in corpus)
+    return scanned, per_page, emails, phones
+
+
+def benchmark_visible_text(corpus):
+    """Compare regexes over raw HTML with regexes over visible text"""
+    enabled = app_config.VISIBLE_TEXT_EXTRACTION
+    results = {}
+    try:
+        for label, visible in (("raw HTML", False), ("visible text", True)):
+            app_config.VISIBLE_TEXT_EXTRACTION = visible
+            results[label] = run_extraction(corpus)
+    finally:
+        app_config.VISIBLE_TEXT_EXTRACTION = enabled
+
+    print(f"  {'input':<14}{'bytes scanned':>16}{'ms/page':>10}{'emails':>8}{'phones':>8}")
+    for label, (scanned, per_page, emails, phones) in results.items():
+        print(f"  {label:<14}{scanned:>16,}{per_page * 1000:>10.2f}{emails:>8}{phones:>8}")
+    raw, visible = results["raw HTML"], results["visible text"]
+    print(f"  → {raw[0] / max(visible[0], 1):.1f}x fewer bytes, {raw[1] / max(visible[1], 1e-9):.1f}x faster per page")
+
+LEGACY_EMAIL_FALSE_POSITIVES = [
+    'example@', '@example', 'test@', '@test', 'admin@admin',
+    'user@user', 'email@email', 'contact@contact', 'noreply@',
+    'no-reply@', 'donotreply@', 'info@info', 'support@support'
+]
+
+
+def legacy_clean_phone(phone):
+    cleaned = re.sub(r'[^\d+]', '', str(phone))
+    if cleaned.startswith('1') and len(cleaned) == 11:
+        cleaned = cleaned[1:]
+    elif cleaned.startswith('+1') and len(cleaned) == 12:
+        cleaned = cleaned[2:]
+    return cleaned
+
+
+def legacy_is_valid_phone(phone):
+    digits_only = re.sub(r'\D', '', phone)
+    if len(digits_only) < 10 or len(digits_only) > 15:
+        return False
+    if len(digits_only) == 10 and digits_only[0] in ['0', '1']:
+        return False
+    if len(digits_only) == 11 and (not digits_only.startswith('1') or digits_only[1] in ['0', '1']):
+        return False
+    check_digits = digits_only[-10:] if len(digits_only) > 10 else digits_only
+    return check_digits not in LEGACY_INVALID_NUMBERS
+
+
+def legacy_phones(text):
+    """Seven re.findall passes with per-match re.sub cleaning, as before"""
+    found = set()
+    for pattern in LEGACY_PHONE_PATTERNS:
+        for match in re.findall(pattern, text):
+            phone = legacy_clean_phone(''.join(match) if isinstance(match, tuple) else match)
+            if legacy_is_valid_phone(phone):
+                found.add(phone)
+    return found
+
+
+def single_pass_phones(text):
+    """One finditer pass of PHONE_PATTERN with table-driven cleaning"""
+    found = set()
+    for match in PHONE_PATTERN.finditer(text):
+        phone = clean_phone(match.group())
+        if is_valid_phone(phone):
+            found.add(phone)
+    return found
+
+
+def benchmark_phone_engine(corpus):
+    """Compare the legacy multi-pattern phone scan with the single-pass engine on the same text"""
+    texts = [page_text(html).text for html in corpus]
+    legacy = time_pages(texts, legacy_phones)
+    single = time_pages(texts, single_pass_phones)
+    agree = sum(legacy_phones(text) == single_pass_phones(text) for text in texts)
+
+    print(f"  {'engine':<14}{'ms/page':>10}")
+    print(f"  {'7 patterns':<14}{legacy * 1000:>10.3f}")
+    print(f"  {'single pass':<14}{single * 1000:>10.3f}")
+    print(f"  → {legacy / max(single, 1e-9):.1f}x faster, same numbers on {agree}/{len(texts)} pages")
+
+
+def legacy_email_filter(candidates, false_positives):
+    """Substring loop over a Python list for every candidate, as before"""
+    kept = []
+    for email in candidates:
+        email_lower = email.lower()
+        if not any(fp in email_lower for fp in false_positives):
+            kept.append(email_lower)
+    return kept
+
+
+def compiled_email_filter(candidates, rules):
+    """Compiled email rules"""
+    return [email.lower() for email in candidates if not rules.blocks(email.lower())]
+
+
+def time_filter(func, candidates, repeat=3):
+    """Best-of-repeat microseconds per candidate"""
+    best = min(timed(func, candidates) for _ in range(repeat))
+    return best / max(len(candidates), 1) * 1e6
+
+
+def timed(func, candidates):
+    start = time.perf_counter()
+    func(candidates)
+    return time.perf_counter() - start
+
+
+def benchmark_email_filter(corpus):
+    """Compare the legacy substring loop with the compiled rules, with the shipped and a 10k-domain deny list"""
+    candidates = [email for html in corpus for email in EMAIL_PATTERN.findall(html)]
+    candidates = (candidates * (2000 // max(len(candidates), 1) + 1))[:2000] if candidates else ['info@acme.com']
+    big_domains = [f"directory{i}.com" for i in range(10000)]
+
+    big_substrings = ['@' + domain for domain in big_domains]
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.writelines(f"domain {domain}\n" for domain in big_domains)
+    try:
+        big_rules = EmailRules(f.name)
+    finally:
+        os.remove(f.name)
+
+    rows = [
+        ("shipped rules", email_rules.rule_count,
+         time_filter(lambda c: legacy_email_filter(c, LEGACY_EMAIL_FALSE_POSITIVES), candidates),
+         time_filter(lambda c: compiled_email_filter(c, email_rules), candidates)),
+        ("10k domains", big_rules.rule_count,
+         time_filter(lambda c: legacy_email_filter(c, big_substrings), candidates),
+         time_filter(lambda c: compiled_email_filter(c, big_rules), candidates)),
+    ]
+    print(f"  {'deny list':<16}{'rules':>7}{'loop us/email':>15}{'compiled us/email':>19}")
+    for label, rule_count, legacy, compiled in rows:
+        print(f"  {label:<16}{rule_count:>7}{legacy:>15.2f}{compiled:>19.2f}")
+    kept_legacy = len(set(legacy_email_filter(candidates, LEGACY_EMAIL_FALSE_POSITIVES)))
+    kept_compiled = len(set(compiled_email_filter(candidates, email_rules)))
+    print(f"  → {kept_legacy - kept_compiled} more of {len(set(candidates))} distinct candidates dropped by the shipped rules")
+
+
+if __name__ == "__main__":
+    corpus, description = load_corpus(sys.argv[1:])
+    print(f"⏱️ Benchmarking contact extraction over {description}...\n")
+
+    print("1. Raw HTML vs visible-text stage")
+    benchmark_visible_text(corpus)
+
+    print("\n2. Phone extraction engine")
+    benchmark_phone_engine(corpus)
+
+    print("\n3. Email candidate filter")
+    benchmark_email_filter(corpus)
@@ -35,6 +35,9 @@ class AppConfig:
         "max_retries": 3
     }
     
+    # Browser identity used by Chrome and the HTTP fetch engine
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    
     # File paths
     DATA_DIR = "data"
     RESULTS_DIR = "results"
@@ -44,8 +47,10 @@ class AppConfig:
     LOGS_DIR = "logs"
     
     # Export settings
-    EXPORT_FORMATS = ["xlsx", "csv", "json"]
+    EXPORT_FORMATS = ["xlsx", "csv", "json", "parquet", "arrow"]
     DEFAULT_EXPORT_FORMAT = "xlsx"
+    EXPORT_FLUSH_EVERY = 25  # Rows between flushes of streaming export files
+    EXPORT_ROW_GROUP_SIZE = 5000  # Rows per Parquet row group / Arrow record batch
     
     # Logging configuration
     LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
@@ -59,7 +64,58 @@ class AppConfig:
     LOCKOUT_DURATION = 300  # 5 minutes in seconds
     
     # Performance settings
-    MAX_CONCURRENT_SCRAPERS = 3
+    MAX_CONCURRENT_SCRAPERS = 3  # Also the size of the shared Chrome driver pool
+    DRIVER_MAX_USES = 25  # Recycle a pooled Chrome session after this many leases
+    DRIVER_LEASE_TIMEOUT = 120  # Seconds to wait for a free pooled driver
+    FETCH_CONCURRENCY = 20  # Pages fetched at once by the async HTTP engine
+    FETCH_PER_HOST_LIMIT = 2  # Concurrent requests allowed against a single host
+    POLITENESS_BURST = 1  # Requests a domain may receive back to back before delay_between_requests applies
+    HTTP_MAX_CONNECTIONS = 20  # Pooled connections kept by the shared HTTP client
+    HTTP_KEEPALIVE_EXPIRY = 30  # Seconds an idle pooled connection stays open
+    HTTP2_ENABLED = True  # Negotiate HTTP/2 when the h2 package is installed
+    DNS_CACHE_ENABLED = True  # Resolve each host once per DNS_CACHE_TTL in-process
+    DNS_CACHE_TTL = 300
+    ROBOTS_ENABLED = True  # Skip URLs disallowed by robots.txt and honour Crawl-delay
+    ROBOTS_USER_AGENT = "ScrapeOn"  # Product token matched against robots.txt User-agent groups
+    ROBOTS_TTL = 24 * 3600  # Seconds a fetched robots.txt policy is reused
+    ROBOTS_ERROR_TTL = 3600  # Shorter reuse when robots.txt could not be fetched
+    ROBOTS_MAX_CRAWL_DELAY = 30  # Cap on Crawl-delay values applied to the scheduler
+    CONTACT_CRAWL_DEPTH = 1  # Same-site link levels followed from each search result; 0 = results only
+    CONTACT_SITE_PAGE_BUDGET = 4  # Max pages fetched per site, search results included
+    CONTACT_LINK_MIN_SCORE = 0.3  # Minimum contact-likelihood score for a link to be followed
+    CONTACT_LINKS_PER_PAGE = 3  # Best-scoring links queued from each page
+    SEEN_URL_FILTER_ENABLED = True  # Skip result pages already scanned by a recent run
+    SEEN_URL_TTL = 24 * 3600  # How long a scanned URL is skipped; matches PAGE_CACHE_TTL so skips end when cached copies go stale
+    SEEN_URL_CAPACITY = 200000  # URLs per Bloom filter generation
+    SEEN_URL_ERROR_RATE = 0.001  # False-positive bound of each generation
+    CONTACT_INDEX_ENABLED = True  # Record every email/phone found in the contacts table
+    CONTACTS_NEW_ONLY = False  # Emit only contacts no earlier run has found
+    CONTACT_INDEX_FLUSH_EVERY = 100  # Contact sightings written per transaction
+    DEFAULT_PHONE_COUNTRY_CODE = "1"  # Country code assumed for national numbers when normalizing to E.164
+    EXTRACTION_WORKERS = 0  # Processes for email/phone extraction; 0 uses one per spare CPU core, 1 extracts inline
+    EXTRACTION_POOL_MIN_BYTES = 32 * 1024  # Smaller pages are extracted inline; shipping them costs more than it saves
+    VISIBLE_TEXT_EXTRACTION = True  # Run contact regexes over visible text and mailto:/tel: links instead of raw HTML
+    EMAIL_RULES_FILE = os.path.join(CONFIG_DIR, "email_rules.txt")  # False-positive, blocked-domain and file-extension rules for emails
+    DOMAIN_BLOCKLIST_FILES = [os.path.join(CONFIG_DIR, "blocked_domains.txt")]  # Aggregator, directory and social domains no scraper visits
+    DOMAIN_ALLOWLIST_FILES = [os.path.join(CONFIG_DIR, "allowed_domains.txt")]  # Exceptions to the blocklist; the most specific entry wins
+    PAGE_CACHE_ENABLED = True  # Keep fetched pages on disk under DATA_DIR/page_cache
+    PAGE_CACHE_TTL = 24 * 3600  # Seconds a cached page is served without revalidation
+    PAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Compressed size budget before LRU eviction
+    TIER_MEMORY_TTL = 7 * 24 * 3600  # Seconds to remember whether a domain needs the browser
+    # Upper bounds in seconds for event-driven page waits
+    WAIT_TIMEOUTS = {
+        "page_load": 15,
+        "network_idle": 5,
+        "detail_header": 8,
+        "feed_growth": 6
+    }
+    MAPS_EXTRACTION_MODE = "script"  # "script" (one JS roundtrip) or "selectors"
+    MAPS_DETAIL_WORKERS = 2  # Drivers opening Maps place pages in parallel; 1 = click through the feed
+    MAPS_DETAIL_HEADLESS = True  # Run the parallel detail drivers without a window
+    CHECKPOINT_ENABLED = True  # Record scrape job progress so interrupted jobs can resume
+    CHECKPOINT_FLUSH_EVERY = 20  # Pending checkpoint changes written per transaction
+    CHECKPOINT_FLUSH_INTERVAL = 10  # Max seconds between checkpoint writes
+    CHROMEDRIVER_PATH = None  # Fixed chromedriver binary; skips version resolution when set
     DEFAULT_TIMEOUT = 30
     MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
     
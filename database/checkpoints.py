@@ -0,0 +1,265 @@
+# database/checkpoints.py
+"""
+Durable job state so long scrapes can resume after a crash or restart
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from config.app_config import app_config
+
+JOB_RUNNING = "running"
+JOB_STOPPED = "stopped"
+JOB_FAILED = "failed"
+JOB_COMPLETED = "completed"
+
+
+def create_checkpoint_tables(cursor):
+    """Create the job checkpoint tables alongside scraping_sessions"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            scraper_type TEXT NOT NULL,
+            params TEXT NOT NULL,
+            status TEXT DEFAULT 'running',
+            records_count INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Small JSON values: SERP pages visited, URL frontier, flags
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_job_state (
+            job_id INTEGER NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT,
+            PRIMARY KEY (job_id, key),
+            FOREIGN KEY (job_id) REFERENCES scrape_jobs (id)
+        )
+    """)
+
+    # Set-like progress: scanned URLs, processed Maps place ids
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_job_items (
+            job_id INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            item TEXT NOT NULL,
+            PRIMARY KEY (job_id, kind, item),
+            FOREIGN KEY (job_id) REFERENCES scrape_jobs (id)
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_job_records (
+            job_id INTEGER NOT NULL,
+            seq INTEGER NOT NULL,
+            record TEXT NOT NULL,
+            PRIMARY KEY (job_id, seq),
+            FOREIGN KEY (job_id) REFERENCES scrape_jobs (id)
+        )
+    """)
+
+
+class JobCheckpoint:
+    """Buffered view of one job's state, written in periodic batched transactions"""
+
+    def __init__(self, store, job_id, scraper_type, params, status=JOB_RUNNING,
+                 state=None, items=None, records=None):
+        self.store = store
+        self.job_id = job_id
+        self.scraper_type = scraper_type
+        self.params = params
+        self.status = status
+        self.state = state or {}
+        self.items = items or {}
+        self.records = records or []  # Records emitted before this run
+        self._lock = threading.Lock()
+        self._pending_state = {}
+        self._pending_items = []
+        self._pending_records = []
+        self._next_seq = len(self.records)
+        self._last_flush = time.time()
+
+    def get(self, key, default=None):
+        """Return a stored state value"""
+        return self.state.get(key, default)
+
+    def set(self, key, value):
+        """Update a state value; written on the next flush"""
+        with self._lock:
+            self.state[key] = value
+            self._pending_state[key] = value
+
+    def item_set(self, kind):
+        """Return the set of items of one kind recorded so far"""
+        return self.items.setdefault(kind, set())
+
+    def add(self, kind, item):
+        """Add an item to a set-like progress list"""
+        with self._lock:
+            members = self.items.setdefault(kind, set())
+            if item in members:
+                return
+            members.add(item)
+            self._pending_items.append((kind, item))
+
+    def record(self, record):
+        """Append an emitted record"""
+        with self._lock:
+            self._pending_records.append((self._next_seq, record))
+            self._next_seq += 1
+
+    def maybe_flush(self):
+        """Flush when enough changes piled up or the flush interval passed"""
+        pending = len(self._pending_state) + len(self._pending_items) + len(self._pending_records)
+        if not pending:
+            return
+        if pending >= app_config.CHECKPOINT_FLUSH_EVERY or \
+                time.time() - self._last_flush >= app_config.CHECKPOINT_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self, status=None):
+        """Write pending changes in a single transaction"""
+        with self._lock:
+            state = self._pending_state
+            items = self._pending_items
+            records = self._pending_records
+            self._pending_state, self._pending_items, self._pending_records = {}, [], []
+            if status:
+                self.status = status
+            records_count = self._next_seq
+        self._last_flush = time.time()
+        self.store.write(self.job_id, self.status, records_count, state, items, records)
+
+    def finish(self, status):
+        """Flush everything and mark the job stopped, failed or completed"""
+        self.flush(status)
+
+
+class CheckpointStore:
+    """Create, load and persist scrape job checkpoints in the application database"""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or app_config.DATABASE_PATH
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.init_tables()
+
+    def get_connection(self):
+        """Get database connection"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def init_tables(self):
+        """Create checkpoint tables if needed"""
+        conn = self.get_connection()
+        try:
+            create_checkpoint_tables(conn.cursor())
+            conn.commit()
+        except Exception as e:
+            print(f"Error creating checkpoint tables: {e}")
+            conn.rollback()
+        finally:
+            conn.close()
+
+    def create_job(self, scraper_type, params):
+        """Start a new job and return its checkpoint"""
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO scrape_jobs (scraper_type, params, status)
+                VALUES (?, ?, ?)
+            """, (scraper_type, json.dumps(params), JOB_RUNNING))
+            conn.commit()
+            return JobCheckpoint(self, cursor.lastrowid, scraper_type, params)
+        finally:
+            conn.close()
+
+    def load_job(self, job_id):
+        """Load a job with its state, progress items and emitted records, or None"""
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM scrape_jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            cursor.execute("SELECT key, value FROM scrape_job_state WHERE job_id = ?", (job_id,))
+            state = {key: json.loads(value) for key, value in cursor.fetchall()}
+
+            items = {}
+            cursor.execute("SELECT kind, item FROM scrape_job_items WHERE job_id = ?", (job_id,))
+            for kind, item in cursor.fetchall():
+                items.setdefault(kind, set()).add(item)
+
+            cursor.execute("SELECT record FROM scrape_job_records WHERE job_id = ? ORDER BY seq", (job_id,))
+            records = [json.loads(record) for (record,) in cursor.fetchall()]
+
+            return JobCheckpoint(self, row['id'], row['scraper_type'], json.loads(row['params']),
+                                 row['status'], state, items, records)
+        finally:
+            conn.close()
+
+    def write(self, job_id, status, records_count, state, items, records):
+        """Persist one batch of checkpoint changes atomically"""
+        with self._lock:
+            conn = self.get_connection()
+            try:
+                cursor = conn.cursor()
+                if state:
+                    cursor.executemany("""
+                        INSERT OR REPLACE INTO scrape_job_state (job_id, key, value)
+                        VALUES (?, ?, ?)
+                    """, [(job_id, key, json.dumps(value)) for key, value in state.items()])
+                if items:
+                    cursor.executemany("""
+                        INSERT OR IGNORE INTO scrape_job_items (job_id, kind, item)
+                        VALUES (?, ?, ?)
+                    """, [(job_id, kind, item) for kind, item in items])
+                if records:
+                    cursor.executemany("""
+                        INSERT OR REPLACE INTO scrape_job_records (job_id, seq, record)
+                        VALUES (?, ?, ?)
+                    """, [(job_id, seq, json.dumps(record, default=str)) for seq, record in records])
+                cursor.execute("""
+                    UPDATE scrape_jobs SET status = ?, records_count = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (status, records_count, job_id))
+                conn.commit()
+            except Exception as e:
+                print(f"Error saving checkpoint for job {job_id}: {e}")
+                conn.rollback()
+            finally:
+                conn.close()
+
+    def list_jobs(self, resumable_only=True):
+        """Return recent jobs, newest first"""
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            if resumable_only:
+                cursor.execute("SELECT * FROM scrape_jobs WHERE status != ? ORDER BY id DESC", (JOB_COMPLETED,))
+            else:
+                cursor.execute("SELECT * FROM scrape_jobs ORDER BY id DESC")
+            return [dict(row) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    def delete_job(self, job_id):
+        """Remove a job and all of its checkpoint data"""
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            for table in ("scrape_job_records", "scrape_job_items", "scrape_job_state"):
+                cursor.execute(f"DELETE FROM {table} WHERE job_id = ?", (job_id,))
+            cursor.execute("DELETE FROM scrape_jobs WHERE id = ?", (job_id,))
+            conn.commit()
+        finally:
+            conn.close()
@@ -0,0 +1,238 @@
+# database/contacts.py
+"""
+Cross-session index of every contact the scrapers have found
+"""
+
+import csv
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from config.app_config import app_config
+
+KIND_EMAIL = "email"
+KIND_PHONE = "phone"
+
+# SQLite caps bound parameters per statement; stay well below it
+LOOKUP_BATCH_SIZE = 500
+
+
+def normalize_email(email):
+    return (email or '').strip().lower()
+
+
+def normalize_phone(phone, default_country_code=None):
+    """Return a phone number in E.164 form (+15551234567), or '' if it has too few digits"""
+    phone = (phone or '').strip()
+    digits = re.sub(r'\D', '', phone)
+    if len(digits) < 7:
+        return ''
+    if phone.startswith('+'):
+        return '+' + digits
+    if digits.startswith('00'):
+        return '+' + digits[2:]
+    country_code = default_country_code or app_config.DEFAULT_PHONE_COUNTRY_CODE
+    if len(digits) == 10:
+        return f"+{country_code}{digits}"
+    if len(digits) == 11 and digits.startswith('1'):
+        return '+' + digits
+    return '+' + digits
+
+
+NORMALIZERS = {
+    KIND_EMAIL: normalize_email,
+    KIND_PHONE: normalize_phone
+}
+
+
+def create_contact_tables(cursor):
+    """Create the contacts index"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS contacts (
+            kind TEXT NOT NULL,
+            value TEXT NOT NULL,
+            first_seen TIMESTAMP NOT NULL,
+            last_seen TIMESTAMP NOT NULL,
+            seen_count INTEGER DEFAULT 1,
+            source_url TEXT,
+            scraper_type TEXT,
+            PRIMARY KEY (kind, value)
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS contacts_last_seen ON contacts (kind, last_seen)")
+
+
+class ContactIndex:
+    """Normalized contacts with first/last seen timestamps and their source"""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or app_config.DATABASE_PATH
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.init_tables()
+
+    def get_connection(self):
+        """Get database connection"""
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def init_tables(self):
+        """Create the contacts table if needed"""
+        conn = self.get_connection()
+        try:
+            create_contact_tables(conn.cursor())
+            conn.commit()
+        except Exception as e:
+            print(f"Error creating contacts table: {e}")
+            conn.rollback()
+        finally:
+            conn.close()
+
+    def known(self, kind, values):
+        """Return the subset of normalized values already in the index, in batched queries"""
+        values = list(values)
+        found = set()
+        if not values:
+            return found
+        conn = self.get_connection()
+        try:
+            for start in range(0, len(values), LOOKUP_BATCH_SIZE):
+                batch = values[start:start + LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT value FROM contacts WHERE kind = ? AND value IN ({placeholders})", [kind] + batch)
+                found.update(value for (value,) in rows)
+        finally:
+            conn.close()
+        return found
+
+    def upsert(self, kind, sightings, scraper_type=None):
+        """Record sightings [(value, source_url, seen_at)] in one transaction"""
+        if not sightings:
+            return
+        with self._lock:
+            conn = self.get_connection()
+            try:
+                conn.executemany("""
+                    INSERT INTO contacts (kind, value, first_seen, last_seen, seen_count, source_url, scraper_type)
+                    VALUES (?, ?, ?, ?, 1, ?, ?)
+                    ON CONFLICT (kind, value) DO UPDATE SET
+                        first_seen = MIN(first_seen, excluded.first_seen),
+                        last_seen = MAX(last_seen, excluded.last_seen),
+                        seen_count = seen_count + 1
+                """, [(kind, value, seen_at, seen_at, source_url, scraper_type)
+                      for value, source_url, seen_at in sightings])
+                conn.commit()
+            except Exception as e:
+                print(f"Error updating contact index: {e}")
+                conn.rollback()
+            finally:
+                conn.close()
+
+    def session(self, kind, scraper_type=None, new_only=None):
+        """Open a buffered session for one scrape run"""
+        return ContactIndexSession(self, kind, scraper_type, new_only)
+
+    def import_export(self, path):
+        """Seed the index from a previous CSV, XLSX or NDJSON export; returns contacts imported"""
+        imported = 0
+        buffers = {KIND_EMAIL: [], KIND_PHONE: []}
+        for row in read_export_rows(path):
+            seen_at = str(row.get('found_at') or time.strftime("%Y-%m-%d %H:%M:%S"))
+            source_url = row.get('source_url') or row.get('website') or ''
+            for kind, buffer in buffers.items():
+                value = NORMALIZERS[kind](str(row.get(kind) or ''))
+                if value:
+                    buffer.append((value, source_url, seen_at))
+                    imported += 1
+            for kind, buffer in buffers.items():
+                if len(buffer) >= app_config.CONTACT_INDEX_FLUSH_EVERY:
+                    self.upsert(kind, buffer, "import")
+                    buffers[kind] = []
+        for kind, buffer in buffers.items():
+            self.upsert(kind, buffer, "import")
+        return imported
+
+    def count(self, kind=None):
+        """Number of indexed contacts"""
+        conn = self.get_connection()
+        try:
+            if kind:
+                return conn.execute("SELECT COUNT(*) FROM contacts WHERE kind = ?", (kind,)).fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+        finally:
+            conn.close()
+
+
+class ContactIndexSession:
+    """Per-run view: one lookup per page, sightings written in batches"""
+
+    def __init__(self, index, kind, scraper_type=None, new_only=None):
+        self.index = index
+        self.kind = kind
+        self.scraper_type = scraper_type
+        self.new_only = app_config.CONTACTS_NEW_ONLY if new_only is None else new_only
+        self.normalize = NORMALIZERS[kind]
+        self._pending = []
+        self.skipped = 0
+
+    def filter_new(self, values, source_url):
+        """Record sightings of values and return those to emit.
+
+        In new-only mode contacts seen by an earlier run are dropped.
+        """
+        normalized = {value: self.normalize(value) for value in values}
+        known = self.index.known(self.kind, {key for key in normalized.values() if key})
+        seen_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        for key in normalized.values():
+            if key:
+                self._pending.append((key, source_url, seen_at))
+        if len(self._pending) >= app_config.CONTACT_INDEX_FLUSH_EVERY:
+            self.flush()
+
+        if not self.new_only:
+            return list(values)
+        fresh = [value for value in values if normalized[value] not in known]
+        self.skipped += len(values) - len(fresh)
+        return fresh
+
+    def flush(self):
+        """Write buffered sightings"""
+        pending, self._pending = self._pending, []
+        self.index.upsert(self.kind, pending, self.scraper_type)
+
+
+def read_export_rows(path):
+    """Yield dict rows from a CSV, XLSX or NDJSON export"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+    elif extension in ('.xlsx', '.xlsm'):
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True)
+        try:
+            for sheet in workbook.worksheets:
+                rows = sheet.iter_rows(values_only=True)
+                header = next(rows, None)
+                if not header:
+                    continue
+                header = [str(cell or '').strip().lower() for cell in header]
+                for values in rows:
+                    yield dict(zip(header, values))
+        finally:
+            workbook.close()
+    elif extension in ('.ndjson', '.jsonl', '.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            first = f.read(1)
+            f.seek(0)
+            if first == '[':
+                yield from json.load(f)
+            else:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+    else:
+        raise ValueError(f"Unsupported export file: {path}")
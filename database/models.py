@@ -6,6 +6,9 @@ import os
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
+from database.checkpoints import create_checkpoint_tables
+from database.contacts import create_contact_tables
+
 class User:
     def __init__(self, id=None, username=None, email=None, password_hash=None, 
                  full_name=None, plan_id=1, created_at=None, last_login=None, 
@@ -141,6 +144,12 @@ class DatabaseManager:
                 )
             """)
             
+            # Create resumable job checkpoint tables
+            create_checkpoint_tables(cursor)
+            
+            # Create cross-session contact index
+            create_contact_tables(cursor)
+            
             conn.commit()
             
         except Exception as e:
@@ -10,9 +10,10 @@ from database.models import DatabaseManager
 import threading
 import os
 import time
-import requests
 import webbrowser
 
+from utils.http_client import http_client
+
 class MainWindow(ctk.CTk):
     def __init__(self, user, app_name="ScrapeOn", web_api_url=None):
         super().__init__()
@@ -241,7 +242,7 @@ class MainWindow(ctk.CTk):
             stats = self.db_manager.get_user_stats(self.user.id)
             
             # Send to web backend
-            requests.post(
+            http_client.post(
                 f"{self.web_api_url}/usage/sync",
                 json={
                     "user_id": self.user.username,  # or however you identify users
@@ -421,7 +422,7 @@ class MainWindow(ctk.CTk):
         # Sync with web backend if web user
         if self.is_web_user():
             try:
-                requests.post(
+                http_client.post(
                     f"{self.web_api_url}/scraping/log",
                     json={
                         "user_id": self.user.username,
@@ -12,6 +12,7 @@ from config.theme import ScrapeOnTheme
 from config.web_config import web_config
 from config.app_config import app_config
 from database.models import DatabaseManager
+from utils.driver_pool import driver_pool
 import os
 import sys
 import logging
@@ -256,6 +257,7 @@ class ScrapeOnApp:
             
         finally:
             # Cleanup
+            driver_pool.close_all()
             if self.logger:
                 self.logger.info("Application shutdown")
 
@@ -278,6 +280,10 @@ Options:
   -v, --version  Show version information
   --config       Show current configuration
   --validate     Validate environment and exit
+  --refresh-driver  Re-resolve chromedriver for the installed Chrome
+  --selector-report Show Google Maps selector hit rates
+  --jobs         List interrupted scrape jobs that can be resumed
+  --import-contacts FILE...  Seed the contact index from earlier CSV/XLSX/NDJSON exports
 
 Environment Variables:
   SCRAPEON_ENV   Set to 'production' for production mode (default: development)
@@ -290,6 +296,38 @@ Examples:
         elif sys.argv[1] == '--config':
             app_config.print_config()
             return
+        elif sys.argv[1] == '--refresh-driver':
+            from utils.driver_resolver import chromedriver_resolver
+            try:
+                driver_path = chromedriver_resolver.refresh()
+                print(f"✅ chromedriver resolved: {driver_path}")
+            except Exception as e:
+                print(f"❌ Could not resolve chromedriver: {e}")
+                sys.exit(1)
+            return
+        elif sys.argv[1] == '--selector-report':
+            from utils.selector_stats import selector_registry
+            print(selector_registry.format_report())
+            return
+        elif sys.argv[1] == '--jobs':
+            from database.checkpoints import CheckpointStore
+            jobs = CheckpointStore().list_jobs()
+            if not jobs:
+                print("No interrupted scrape jobs")
+            for job in jobs:
+                print(f"#{job['id']}  {job['scraper_type']:<12} {job['status']:<8} "
+                      f"{job['records_count']} records  {job['updated_at']}  {job['params']}")
+            return
+        elif sys.argv[1] == '--import-contacts':
+            from database.contacts import ContactIndex
+            contact_index = ContactIndex()
+            for path in sys.argv[2:]:
+                try:
+                    print(f"✅ {path}: {contact_index.import_export(path)} contacts imported")
+                except Exception as e:
+                    print(f"❌ {path}: {e}")
+            print(f"📇 Contact index holds {contact_index.count()} contacts")
+            return
         elif sys.argv[1] == '--validate':
             app = ScrapeOnApp()
             errors = app.validate_environment()
@@ -0,0 +1,161 @@
+# scrapers/contact_extractors.py
+"""
+Contact extraction functions shared by the scrapers and the extraction process pool
+"""
+
+import re
+from itertools import chain
+
+from config.app_config import app_config
+from utils.email_rules import email_rules
+from utils.page_text import PageText, visible_text
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Characters allowed between digit groups of a phone number
+PHONE_SEPARATOR = r'[ \t\xa0.\-]'
+# One pass finds every candidate the scrapers accept: international numbers,
+# (415) 555-0199 and 415-555-0199 style national numbers, and bare 10-digit runs
+PHONE_PATTERN = re.compile(r"""
+    (?<![\w+])
+    (?:
+        \+\d{1,3}{sep}?(?:\(\d{1,4}\){sep}?)?\d{1,4}(?:{sep}?\d{1,4}){1,4}
+      | \(\d{3}\){sep}?\d{3}{sep}?\d{4}
+      | \d{3}{sep}?\d{3}{sep}?\d{4}
+    )
+    (?!\w)
+""".replace('{sep}', PHONE_SEPARATOR), re.X)
+# "+49 (0)30 ..." - the bracketed trunk zero is dialled only nationally, never after the country code
+TRUNK_ZERO_PATTERN = re.compile(r'^\s*(\+\d{1,3})' + PHONE_SEPARATOR + r'?\(0\)')
+NON_PHONE_CHARS = re.compile(r'[^\d+]')
+NON_DIGITS = re.compile(r'\D')
+# (prefix, cleaned length) -> characters to strip to get the national number
+TRUNK_PREFIXES = {
+    ('+1', 12): 2,
+    ('1', 11): 1
+}
+INVALID_PHONE_NUMBERS = frozenset([
+    '0000000000', '1111111111', '2222222222', '3333333333',
+    '4444444444', '5555555555', '6666666666', '7777777777',
+    '8888888888', '9999999999', '1234567890', '0123456789',
+    '9876543210'
+])
+
+
+def page_text(page_source):
+    """Visible text and link contacts of a page, or the raw source when the text stage is off"""
+    if app_config.VISIBLE_TEXT_EXTRACTION:
+        return visible_text(page_source)
+    return PageText(page_source or "", [], [])
+
+
+def extract_emails(page_source):
+    """Extract emails from page source"""
+    emails = []
+    page = page_text(page_source)
+
+    # Extract emails using regex, plus the bare addresses of mailto: links ("Jane <jane@acme.com>")
+    found_emails = [email for value in page.emails for email in EMAIL_PATTERN.findall(value)]
+    found_emails += EMAIL_PATTERN.findall(page.text)
+
+    # Filter out common false positives
+    for email in found_emails:
+        if is_valid_email(email):
+            emails.append(email.lower())
+
+    return list(set(emails))  # Remove duplicates
+
+
+def is_valid_email(email):
+    """Validate email address"""
+    if not email or '@' not in email:
+        return False
+
+    # Skip false positives, blocked domains and asset file names (config/email_rules.txt)
+    if email_rules.blocks(email.lower()):
+        return False
+
+    # Basic email validation
+    parts = email.split('@')
+    if len(parts) != 2:
+        return False
+
+    local, domain = parts
+    if len(local) < 1 or len(domain) < 3:
+        return False
+
+    if '.' not in domain:
+        return False
+
+    # Check for valid domain extensions
+    domain_parts = domain.split('.')
+    if len(domain_parts[-1]) < 2:
+        return False
+
+    return True
+
+
+def extract_phones(page_source):
+    """Extract phone numbers from page source"""
+    page = page_text(page_source)
+    found_phones = set()
+
+    # tel: links first, then every candidate from one pass of the combined pattern
+    candidates = chain(page.phones, (match.group() for match in PHONE_PATTERN.finditer(page.text)))
+    for phone_str in candidates:
+        # Clean and validate
+        cleaned_phone = clean_phone(phone_str)
+        if is_valid_phone(cleaned_phone):
+            found_phones.add(cleaned_phone)
+
+    return list(found_phones)
+
+
+def clean_phone(phone):
+    """Clean phone number string"""
+    if not phone:
+        return ""
+
+    # Remove all non-digit characters except +
+    cleaned = NON_PHONE_CHARS.sub('', TRUNK_ZERO_PATTERN.sub(r'\1', str(phone), count=1))
+
+    # Drop the US country code
+    strip = TRUNK_PREFIXES.get((cleaned[:2], len(cleaned))) or TRUNK_PREFIXES.get((cleaned[:1], len(cleaned)))
+    return cleaned[strip:] if strip else cleaned
+
+
+def is_valid_phone(phone):
+    """Validate phone number"""
+    if not phone:
+        return False
+
+    # Remove any remaining non-digits
+    digits_only = NON_DIGITS.sub('', phone)
+    length = len(digits_only)
+
+    # Check length (allow 10-15 digits for international numbers)
+    if length < 10 or length > 15:
+        return False
+
+    # For 10-digit numbers (US format) the first digit should not be 0 or 1
+    if length == 10 and digits_only[0] in '01':
+        return False
+
+    # For national 11-digit numbers (US with country code) the area code should not start with 0 or 1;
+    # "+..." numbers left after clean_phone are international ones
+    if length == 11 and not phone.startswith('+') and (digits_only[0] != '1' or digits_only[1] in '01'):
+        return False
+
+    # Check the 10-digit version against obviously invalid numbers
+    return digits_only[-10:] not in INVALID_PHONE_NUMBERS
+
+
+def format_phone(phone):
+    """Format phone number for display"""
+    digits = NON_DIGITS.sub('', phone)
+    if len(digits) == 10:
+        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+    elif len(digits) == 11 and digits[0] == '1':
+        return f"+1 ({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
+    else:
+        return phone
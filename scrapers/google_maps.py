@@ -1,58 +1,262 @@
 # scrapers/google_maps.py
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-import pandas as pd
-import time
-import re
 from urllib.parse import quote
 import json
-import os
+import queue
+import threading
+
+from config.app_config import app_config
+from database.checkpoints import CheckpointStore, JOB_COMPLETED, JOB_FAILED, JOB_STOPPED
+from scrapers.maps_feed import FeedCursor
+from utils.domain_blocklist import domain_blocklist
+from utils.driver_pool import driver_pool
+from utils.export_sinks import export_records, stream_to_sink
+from utils.selector_stats import selector_registry
+from utils.streaming import aiter_in_thread
+from utils.waits import (
+    wait_for, wait_timeout, current_place_key,
+    detail_header_changed, feed_length_increased, network_idle, place_changed
+)
+
+# Selector fallback table for the place details panel, tried in order per field
+PLACE_SELECTORS = {
+    'name': [
+        "h1.DUwDvf.lfPIob",
+        ".DUwDvf.lfPIob",
+        "h1",
+        ".x3AX1-LfntMc-header-title-title",
+        ".qrShPb .fontHeadlineLarge",
+        "[data-attrid='title']",
+        ".SPZz6b h1",
+        ".qrShPb",
+        "div[role='main'] h1"
+    ],
+    'name_fallback': [
+        "h1, h2, h3",
+        "[data-value*='title'], [aria-label*='title']",
+        ".fontHeadlineLarge, .fontHeadlineMedium",
+        "[role='heading']"
+    ],
+    'address': [
+        "[data-item-id='address']",
+        ".rogA2c .Io6YTe",
+        ".Io6YTe.fontBodyMedium",
+        "[data-value='Address']",
+        ".AeaXub .fontBodyMedium",
+        "button[data-item-id='address']",
+        "[aria-label*='Address']"
+    ],
+    'phone': [
+        "[data-item-id*='phone']",
+        "[data-value='Phone']",
+        ".rogA2c[data-item-id*='phone']",
+        "button[data-item-id*='phone']",
+        "[aria-label*='Phone'], [aria-label*='phone']"
+    ],
+    'website': [
+        "[data-item-id='authority']",
+        "a[href*='http']",
+        "button[data-item-id='authority']"
+    ],
+    'rating': [
+        ".F7nice span",
+        ".ceNzKf",
+        "[data-value='Rating']",
+        ".fontDisplayLarge",
+        ".MW4etd",
+        "span[aria-label*='stars']"
+    ],
+    'category': [
+        ".DkEaL",
+        ".mgr77e .fontBodyMedium",
+        "[data-value='Category']",
+        ".AeaXub .fontBodyMedium",
+        "button[jsaction*='category']"
+    ]
+}
+
+NAME_STOPWORDS = ['results', 'result', '', 'google maps']
+FALLBACK_NAME_STOPWORDS = ['results', 'result', 'google maps', 'directions', 'website']
+
+# Evaluates the whole PLACE_SELECTORS table in the browser and returns
+# {fields: {...}, matched: {...}} using the same acceptance rules as
+# extract_business_data_selectors
+EXTRACT_PLACE_SCRIPT = """
+var table = arguments[0];
+var nameStop = %s;
+var fallbackStop = %s;
+var fields = {}, matched = {};
+
+function query(selector) {
+    try { return document.querySelectorAll(selector); } catch (e) { return []; }
+}
+// WebDriver's .text is '' for elements that are not rendered, so match it here
+function textOf(el) {
+    if (!el.getClientRects().length) return '';
+    return (el.innerText || '').trim();
+}
+
+function firstMatch(field, accept) {
+    var selectors = table[field] || [];
+    for (var i = 0; i < selectors.length; i++) {
+        var nodes = query(selectors[i]);
+        if (!nodes.length) continue;
+        var value = accept(nodes[0]);
+        if (value) {
+            fields[field] = value;
+            matched[field] = selectors[i];
+            return true;
+        }
+    }
+    return false;
+}
+
+firstMatch('name', function(el) {
+    var text = textOf(el);
+    return nameStop.indexOf(text.toLowerCase()) === -1 ? text : '';
+});
+
+if (!fields.name) {
+    var general = table['name_fallback'] || [];
+    for (var i = 0; i < general.length && !fields.name; i++) {
+        var nodes = query(general[i]);
+        for (var j = 0; j < nodes.length; j++) {
+            var text = textOf(nodes[j]);
+            if (text.length > 3 && fallbackStop.indexOf(text.toLowerCase()) === -1) {
+                fields.name = text;
+                matched.name = general[i];
+                break;
+            }
+        }
+    }
+}
+
+['address', 'phone', 'category'].forEach(function(field) {
+    firstMatch(field, textOf);
+});
+
+// Every website candidate goes back to Python, which picks the first one not on the domain blocklist
+var websites = [];
+(table['website'] || []).forEach(function(selector) {
+    var nodes = query(selector);
+    for (var i = 0; i < nodes.length; i++) {
+        var href = nodes[i].href || nodes[i].getAttribute('href') || '';
+        if (href) websites.push([selector, href]);
+    }
+});
+
+firstMatch('rating', function(el) {
+    var text = textOf(el);
+    return /[0-9]/.test(text) ? text : '';
+});
+
+return {fields: fields, matched: matched, websites: websites};
+""" % (json.dumps(NAME_STOPWORDS), json.dumps(FALLBACK_NAME_STOPWORDS))
+
+
+def empty_business_data():
+    """Return a business record with every field blank"""
+    return {
+        'name': '',
+        'address': '',
+        'phone': '',
+        'website': '',
+        'rating': '',
+        'total_reviews': '',
+        'category': '',
+        'hours': '',
+        'price_range': ''
+    }
+
+
+def split_rating(rating_text):
+    """Split '4.5(123)' style text into rating and review count"""
+    if '(' in rating_text:
+        parts = rating_text.split('(')
+        total_reviews = parts[1].replace(')', '').strip() if len(parts) > 1 else ''
+        return parts[0].strip(), total_reviews
+    return rating_text, ''
+
 
 class GoogleMapsScraper:
-    def __init__(self):
+    def __init__(self, extraction_mode=None, detail_workers=None):
         self.driver = None
         self.results = []
+        self.extraction_mode = extraction_mode or app_config.MAPS_EXTRACTION_MODE
+        self.detail_workers = detail_workers or app_config.MAPS_DETAIL_WORKERS
+        self.checkpoints = CheckpointStore()
         
     def setup_driver(self, headless=False):
-        """Setup Chrome driver with options"""
-        chrome_options = Options()
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        if headless:
-            chrome_options.add_argument("--headless")
-        
+        """Lease a warm Chrome driver from the shared pool"""
         try:
-            # Use WebDriver Manager to automatically download ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.driver = driver_pool.acquire(headless=headless)
             return True
         except Exception as e:
             print(f"Error setting up driver: {e}")
             return False
+    
+    def release_driver(self):
+        """Return the leased driver to the shared pool"""
+        if self.driver:
+            driver_pool.release(self.driver)
+            self.driver = None
         
-    def scrape(self, query, location="", max_results=20, progress_callback=None):
+    def scrape(self, query, location="", max_results=20, progress_callback=None, stop_callback=None, sink=None):
         """Scrape Google Maps for business information"""
-        self.results = []
+        records = self.iter_scrape(query, location, max_results, progress_callback, stop_callback)
+        self.results = list(stream_to_sink(records, sink))
+        return self.results
+    
+    def resume(self, job_id, progress_callback=None, stop_callback=None, sink=None):
+        """Continue an interrupted job; returns its restored and newly extracted businesses"""
+        records = self.iter_resume(job_id, progress_callback, stop_callback)
+        self.results = list(stream_to_sink(records, sink))
+        return self.results
+    
+    def iter_resume(self, job_id, progress_callback=None, stop_callback=None):
+        """Yield a checkpointed job's businesses, then continue down the feed"""
+        job = self.checkpoints.load_job(job_id)
+        if not job or job.scraper_type != "google_maps":
+            if progress_callback:
+                progress_callback(f"❌ No Google Maps job #{job_id} to resume")
+            return
         
+        params = job.params
+        yield from self.iter_scrape(params['query'], params['location'], params['max_results'],
+                                    progress_callback, stop_callback, job=job)
+    
+    def iter_scrape(self, query, location="", max_results=20, progress_callback=None, stop_callback=None, job=None):
+        """Yield each business as soon as it is extracted"""
         if not self.setup_driver():
             if progress_callback:
                 progress_callback("❌ Error: Could not setup Chrome driver")
-            return []
+            return
+        
+        # Create the job only once a driver is leased, so a failed setup leaves no "running" job behind
+        if job is None and app_config.CHECKPOINT_ENABLED:
+            job = self.checkpoints.create_job(
+                "google_maps", {'query': query, 'location': location, 'max_results': int(max_results)})
+        
+        found = 0
+        status = JOB_COMPLETED
         
         try:
+            # Replay businesses saved by an interrupted run of this job
+            if job and job.records:
+                if progress_callback:
+                    progress_callback(f"♻️ Resuming job #{job.job_id} with {len(job.records)} businesses already extracted")
+                for business_data in job.records:
+                    found += 1
+                    yield business_data
+                if found >= int(max_results):
+                    if progress_callback:
+                        progress_callback(f"✅ Scraping completed! Found {found} results")
+                    return
+            
             # Build search query
             search_query = f"{query}"
             if location:
@@ -65,39 +269,64 @@ class GoogleMapsScraper:
             maps_url = f"https://www.google.com/maps/search/{quote(search_query)}"
             self.driver.get(maps_url)
             
-            # Wait for page to load
-            time.sleep(5)
-            
-            if progress_callback:
-                progress_callback("📍 Page loaded. Looking for results...")
-            
             # Wait for results to appear
             try:
-                WebDriverWait(self.driver, 15).until(
+                WebDriverWait(self.driver, wait_timeout("page_load")).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "[role='main']"))
                 )
             except:
                 if progress_callback:
                     progress_callback("⚠️ No results found or page didn't load properly")
-                return []
+                status = JOB_FAILED
+                return
             
-            # Scroll and collect results
-            self.scroll_and_collect_results(max_results, progress_callback)
+            # Let the initial feed requests settle
+            wait_for(self.driver, network_idle(), wait_timeout("network_idle"))
             
             if progress_callback:
-                progress_callback(f"✅ Scraping completed! Found {len(self.results)} results")
+                progress_callback("📍 Page loaded. Looking for results...")
+            
+            # Scroll and collect results; places processed before an interruption are skipped
+            remaining = int(max_results) - found
+            # Detail workers only use free pool slots and always leave one for the next scrape's main driver
+            detail_workers = min(self.detail_workers, driver_pool.free_slots() - 1)
+            if self.detail_workers > 1 and detail_workers > 0:
+                collected = self.iter_results_parallel(remaining, progress_callback, stop_callback, job, detail_workers)
+            else:
+                collected = self.iter_feed_results(remaining, progress_callback, stop_callback, job)
+            
+            for business_data in collected:
+                found += 1
+                yield business_data
+            
+            if stop_callback and stop_callback():
+                status = JOB_STOPPED
+            elif progress_callback:
+                progress_callback(f"✅ Scraping completed! Found {found} results")
             
         except Exception as e:
+            status = JOB_FAILED
             if progress_callback:
                 progress_callback(f"❌ Error during scraping: {str(e)}")
+        except GeneratorExit:
+            status = JOB_STOPPED
+            raise
         finally:
-            if self.driver:
-                self.driver.quit()
-                
-        return self.results
+            self.release_driver()
+            selector_registry.save()
+            if job:
+                job.finish(status)
+                if status != JOB_COMPLETED and progress_callback:
+                    progress_callback(f"💾 Progress saved; resume with job #{job.job_id}")
+    
+    async def aiter_scrape(self, query, location="", max_results=20, progress_callback=None, stop_callback=None):
+        """Async variant of iter_scrape; the scrape runs on a worker thread"""
+        async for business_data in aiter_in_thread(
+                self.iter_scrape, query, location, max_results, progress_callback, stop_callback=stop_callback):
+            yield business_data
         
-    def scroll_and_collect_results(self, max_results, progress_callback, stop_callback=None):
-        """Scroll through results and collect business data"""
+    def iter_feed_results(self, max_results, progress_callback, stop_callback=None, job=None):
+        """Scroll through results, clicking each card, and yield business data"""
         try:
             # Convert max_results to int to avoid comparison issues
             max_results = int(max_results)
@@ -105,11 +334,13 @@ class GoogleMapsScraper:
             # Find the scrollable results panel
             results_panel = self.driver.find_element(By.CSS_SELECTOR, "[role='main']")
             
-            collected_names = set()  # Track unique business names
+            # Track processed places by place id, including those from a checkpointed run
+            feed_cursor = FeedCursor(job.item_set('seen') if job else None)
+            found = 0
             scroll_attempts = 0
             max_scroll_attempts = 10
             
-            while len(self.results) < max_results and scroll_attempts < max_scroll_attempts:
+            while found < max_results and scroll_attempts < max_scroll_attempts:
                 # Check for stop signal
                 if stop_callback and stop_callback():
                     if progress_callback:
@@ -117,65 +348,58 @@ class GoogleMapsScraper:
                     break
                 
                 try:
-                    # Find business listings using multiple selectors
-                    business_elements = []
-                    
-                    # Try different selectors for business listings
-                    selectors = [
-                        "[data-result-index]",
-                        ".hfpxzc",
-                        "a[href*='/maps/place/']",
-                        "[jsaction*='mouseover']"
-                    ]
+                    # Only cards loaded since the last scroll are returned
+                    new_cards = feed_cursor.new_cards(self.driver)
                     
-                    for selector in selectors:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                            business_elements = elements
-                            break
-                    
-                    if not business_elements:
+                    if not feed_cursor.last_count:
                         if progress_callback:
                             progress_callback("⚠️ No business elements found on page")
                         break
                     
                     if progress_callback:
-                        progress_callback(f"🔍 Found {len(business_elements)} potential businesses on page")
+                        progress_callback(f"🔍 Found {len(new_cards)} new businesses on page ({feed_cursor.last_count} total)")
                     
-                    # Process each business element
-                    for i, element in enumerate(business_elements):
+                    # Process each new business card
+                    for i, card in enumerate(new_cards):
                         # Check for stop signal in inner loop too
                         if stop_callback and stop_callback():
                             if progress_callback:
                                 progress_callback("Scraping stopped by user")
                             return
                             
-                        if len(self.results) >= max_results:
+                        if found >= max_results:
                             break
+                        
+                        feed_cursor.mark_seen(card.place_id)
                             
                         try:
+                            previous_place = current_place_key(self.driver)
+                            
                             # Scroll element into view
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                            time.sleep(1)
+                            self.driver.execute_script("arguments[0].scrollIntoView(true);", card.element)
                             
-                            # Click on the business to get details
-                            self.driver.execute_script("arguments[0].click();", element)
-                            time.sleep(3)  # Wait for details to load
+                            # Click on the business and wait for its details to render
+                            self.driver.execute_script("arguments[0].click();", card.element)
+                            if not wait_for(self.driver, place_changed(previous_place), wait_timeout("detail_header")) and previous_place:
+                                # Panel still shows the previous place; extracting now would duplicate it
+                                if progress_callback:
+                                    progress_callback(f"⚠️ Details did not load for business {i+1}, skipping")
+                                continue
                             
                             # Extract business data
                             business_data = self.extract_business_data()
                             
                             if business_data and business_data.get('name'):
-                                # Check if we already have this business
-                                if business_data['name'] not in collected_names:
-                                    collected_names.add(business_data['name'])
-                                    self.results.append(business_data)
-                                    
-                                    if progress_callback:
-                                        progress_callback(f"📋 Extracted: {business_data['name']} ({len(self.results)}/{max_results})")
-                                else:
-                                    if progress_callback:
-                                        progress_callback(f"🔄 Duplicate found: {business_data['name']}")
+                                found += 1
+                                if job:
+                                    job.record(business_data)
+                                    job.add('seen', card.place_id)
+                                    job.maybe_flush()
+                                if progress_callback:
+                                    progress_callback(f"📋 Extracted: {business_data['name']} ({found}/{max_results})")
+                                yield business_data
+                            elif job:
+                                job.add('seen', card.place_id)
                         
                         except Exception as e:
                             if progress_callback:
@@ -183,10 +407,10 @@ class GoogleMapsScraper:
                             continue
                     
                     # Check if we need more results
-                    if len(self.results) < max_results:
-                        # Scroll down to load more results
+                    if found < max_results:
+                        # Scroll down and wait for the feed to grow
                         self.driver.execute_script("arguments[0].scrollBy(0, 1000);", results_panel)
-                        time.sleep(3)
+                        wait_for(self.driver, feed_length_increased(feed_cursor.last_count, feed_cursor.selector), wait_timeout("feed_growth"))
                         scroll_attempts += 1
                         
                         if progress_callback:
@@ -204,44 +428,196 @@ class GoogleMapsScraper:
                 progress_callback(f"❌ Error collecting results: {str(e)}")
             print(f"Detailed error: {e}")  # For debugging
     
-    def extract_business_data(self):
+    def iter_results_parallel(self, max_results, progress_callback, stop_callback=None, job=None, detail_workers=None):
+        """Crawl the feed for place links, extract details on a pool of drivers and yield in feed order"""
+        try:
+            max_results = int(max_results)
+            detail_workers = detail_workers or self.detail_workers
+            results_panel = self.driver.find_element(By.CSS_SELECTOR, "[role='main']")
+            
+            jobs = queue.Queue()
+            finished = {}  # feed position -> business data (or None)
+            place_ids = {}  # feed position -> place id, checkpointed once emitted
+            finished_changed = threading.Condition()
+            stop_event = threading.Event()
+            crawl_done = threading.Event()
+            
+            def should_stop():
+                return stop_event.is_set() or bool(stop_callback and stop_callback())
+            
+            def worker():
+                try:
+                    with driver_pool.lease(headless=app_config.MAPS_DETAIL_HEADLESS) as driver:
+                        while not should_stop():
+                            try:
+                                position, href = jobs.get(timeout=0.2)
+                            except queue.Empty:
+                                if crawl_done.is_set():
+                                    break
+                                continue
+                            
+                            business_data = self.extract_place(driver, href)
+                            with finished_changed:
+                                finished[position] = business_data
+                                finished_changed.notify_all()
+                except Exception as e:
+                    print(f"Detail worker stopped: {e}")
+            
+            workers = [threading.Thread(target=worker, name=f"maps-detail-{n}", daemon=True)
+                       for n in range(detail_workers)]
+            for thread in workers:
+                thread.start()
+            
+            feed_cursor = FeedCursor(job.item_set('seen') if job else None)
+            scroll_attempts = 0
+            max_scroll_attempts = 10
+            queued = 0
+            emitted = 0
+            found = 0
+            
+            try:
+                while not should_stop():
+                    # Keep enough places in flight to fill max_results despite misses
+                    if not crawl_done.is_set() and found + (queued - emitted) < max_results + detail_workers:
+                        new_cards = feed_cursor.new_cards(self.driver)
+                        for card in new_cards:
+                            feed_cursor.mark_seen(card.place_id)
+                            if card.href:
+                                place_ids[queued] = card.place_id
+                                jobs.put((queued, card.href))
+                                queued += 1
+                        
+                        if progress_callback and new_cards:
+                            progress_callback(f"🔍 Queued {len(new_cards)} new businesses for detail extraction")
+                        
+                        if scroll_attempts < max_scroll_attempts and feed_cursor.last_count:
+                            self.driver.execute_script("arguments[0].scrollBy(0, 1000);", results_panel)
+                            wait_for(self.driver, feed_length_increased(feed_cursor.last_count, feed_cursor.selector), wait_timeout("feed_growth"))
+                            scroll_attempts += 1
+                        else:
+                            crawl_done.set()
+                    
+                    # Emit finished places in feed order
+                    with finished_changed:
+                        if emitted not in finished:
+                            finished_changed.wait(0.2)
+                        ready = []
+                        while emitted in finished:
+                            ready.append((place_ids.pop(emitted), finished.pop(emitted)))
+                            emitted += 1
+                    
+                    for place_id, business_data in ready:
+                        if found >= max_results:
+                            break
+                        if job:
+                            # Misses count as processed too, so a resumed run skips them
+                            if business_data:
+                                job.record(business_data)
+                            job.add('seen', place_id)
+                            job.maybe_flush()
+                        if business_data:
+                            found += 1
+                            if progress_callback:
+                                progress_callback(f"📋 Extracted: {business_data['name']} ({found}/{max_results})")
+                            yield business_data
+                    
+                    if found >= max_results:
+                        break
+                    if crawl_done.is_set() and emitted >= queued:
+                        break
+                    if not any(thread.is_alive() for thread in workers):
+                        if progress_callback:
+                            progress_callback("❌ No detail workers available")
+                        break
+                
+                if stop_callback and stop_callback() and progress_callback:
+                    progress_callback("Scraping stopped by user")
+            finally:
+                stop_event.set()
+                crawl_done.set()
+                for thread in workers:
+                    thread.join(timeout=wait_timeout("detail_header") + 5)
+            
+        except Exception as e:
+            if progress_callback:
+                progress_callback(f"❌ Error collecting results: {str(e)}")
+            print(f"Detailed error: {e}")  # For debugging
+    
+    def extract_place(self, driver, href):
+        """Open a place URL directly and extract its details"""
+        try:
+            driver.get(href)
+            return self.extract_business_data(driver)
+        except Exception as e:
+            print(f"Error extracting place {href}: {e}")
+            return None
+    
+    def extract_business_data(self, driver=None):
         """Extract business data from the current view"""
-        business_data = {
-            'name': '',
-            'address': '',
-            'phone': '',
-            'website': '',
-            'rating': '',
-            'total_reviews': '',
-            'category': '',
-            'hours': '',
-            'price_range': ''
-        }
+        driver = driver or self.driver
+        
+        # Wait for details panel to show a place
+        wait_for(driver, detail_header_changed(), wait_timeout("detail_header"))
+        
+        business_data = None
+        if self.extraction_mode == "script":
+            try:
+                business_data, matched = self.extract_business_data_script(driver)
+            except Exception as e:
+                print(f"Script extraction failed, falling back to selectors: {e}")
+        
+        if business_data is None:
+            business_data, matched = self.extract_business_data_selectors(driver)
+        
+        # Debug: Print what we extracted
+        if business_data['name']:
+            print(f"Successfully extracted: {business_data['name']}")
+        else:
+            print("Failed to extract business name")
+        
+        return business_data if business_data['name'] and business_data['name'].lower() != 'results' else None
+    
+    def extract_business_data_script(self, driver=None):
+        """Extract all fields with a single execute_script roundtrip; returns (business_data, matched selectors)"""
+        driver = driver or self.driver
+        table = selector_registry.ordered_table(PLACE_SELECTORS)
+        payload = driver.execute_script(EXTRACT_PLACE_SCRIPT, table)
+        fields = payload.get('fields') or {}
+        matched = payload.get('matched') or {}
+        
+        business_data = empty_business_data()
+        for key in ('name', 'address', 'phone', 'category'):
+            business_data[key] = fields.get(key) or ''
+        for selector, href in payload.get('websites') or []:
+            if not domain_blocklist.blocks(href):
+                business_data['website'] = href
+                matched['website'] = selector
+                break
+        self.record_selector_stats(table, matched)
+        
+        rating_text = fields.get('rating') or ''
+        if rating_text:
+            business_data['rating'], business_data['total_reviews'] = split_rating(rating_text)
+        
+        return business_data, matched
+    
+    def extract_business_data_selectors(self, driver=None):
+        """Extract fields with one WebDriver lookup per selector; returns (business_data, matched selectors)"""
+        driver = driver or self.driver
+        business_data = empty_business_data()
+        table = selector_registry.ordered_table(PLACE_SELECTORS)
+        matched = {}
         
         try:
-            # Wait for details panel to load
-            time.sleep(3)
-            
             # Business name - try multiple selectors (updated for current Google Maps)
-            name_selectors = [
-                "h1.DUwDvf.lfPIob",
-                ".DUwDvf.lfPIob", 
-                "h1",
-                ".x3AX1-LfntMc-header-title-title",
-                ".qrShPb .fontHeadlineLarge",
-                "[data-attrid='title']",
-                ".SPZz6b h1",
-                ".qrShPb",
-                "div[role='main'] h1"
-            ]
-            
-            for selector in name_selectors:
+            for selector in table['name']:
                 try:
-                    name_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    name_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                     if name_elements:
                         name_text = name_elements[0].text.strip()
-                        if name_text and name_text.lower() not in ['results', 'result', '', 'google maps']:
+                        if name_text and name_text.lower() not in NAME_STOPWORDS:
                             business_data['name'] = name_text
+                            matched['name'] = selector
                             print(f"Found name with selector {selector}: {name_text}")
                             break
                 except Exception as e:
@@ -251,19 +627,13 @@ class GoogleMapsScraper:
             if not business_data['name']:
                 try:
                     # Look for any heading or prominent text element
-                    general_selectors = [
-                        "h1, h2, h3",
-                        "[data-value*='title'], [aria-label*='title']",
-                        ".fontHeadlineLarge, .fontHeadlineMedium",
-                        "[role='heading']"
-                    ]
-                    
-                    for selector in general_selectors:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    for selector in table['name_fallback']:
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
                         for element in elements:
                             text = element.text.strip()
-                            if text and len(text) > 3 and text.lower() not in ['results', 'result', 'google maps', 'directions', 'website']:
+                            if text and len(text) > 3 and text.lower() not in FALLBACK_NAME_STOPWORDS:
                                 business_data['name'] = text
+                                matched['name'] = selector
                                 print(f"Found name with general selector {selector}: {text}")
                                 break
                         if business_data['name']:
@@ -271,110 +641,44 @@ class GoogleMapsScraper:
                 except:
                     pass
             
-            # Address - try multiple approaches
-            address_selectors = [
-                "[data-item-id='address']",
-                ".rogA2c .Io6YTe",
-                ".Io6YTe.fontBodyMedium", 
-                "[data-value='Address']",
-                ".AeaXub .fontBodyMedium",
-                "button[data-item-id='address']",
-                "[aria-label*='Address']"
-            ]
-            
-            for selector in address_selectors:
-                try:
-                    address_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if address_elements:
-                        address_text = address_elements[0].text.strip()
-                        if address_text:
-                            business_data['address'] = address_text
-                            break
-                except:
-                    continue
-            
-            # Phone number
-            phone_selectors = [
-                "[data-item-id*='phone']",
-                "[data-value='Phone']",
-                ".rogA2c[data-item-id*='phone']",
-                "button[data-item-id*='phone']",
-                "[aria-label*='Phone'], [aria-label*='phone']"
-            ]
-            
-            for selector in phone_selectors:
-                try:
-                    phone_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if phone_elements:
-                        phone_text = phone_elements[0].text.strip()
-                        if phone_text:
-                            business_data['phone'] = phone_text
-                            break
-                except:
-                    continue
+            # Address, phone and category - first non-empty text wins
+            for field in ('address', 'phone', 'category'):
+                for selector in table[field]:
+                    try:
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                        if elements:
+                            text = elements[0].text.strip()
+                            if text:
+                                business_data[field] = text
+                                matched[field] = selector
+                                break
+                    except:
+                        continue
             
             # Website
             try:
-                website_selectors = [
-                    "[data-item-id='authority']",
-                    "a[href*='http']:not([href*='google']):not([href*='maps'])",
-                    "button[data-item-id='authority']"
-                ]
-                
-                for selector in website_selectors:
-                    website_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if website_elements:
-                        href = website_elements[0].get_attribute('href')
-                        if href and 'google' not in href and 'maps' not in href:
+                for selector in table['website']:
+                    # Generic link selectors also match Google's own links, so check every element
+                    for element in driver.find_elements(By.CSS_SELECTOR, selector):
+                        href = element.get_attribute('href')
+                        if href and not domain_blocklist.blocks(href):
                             business_data['website'] = href
+                            matched['website'] = selector
                             break
+                    if business_data['website']:
+                        break
             except:
                 pass
             
             # Rating and reviews
-            rating_selectors = [
-                ".F7nice span",
-                ".ceNzKf",
-                "[data-value='Rating']",
-                ".fontDisplayLarge",
-                ".MW4etd",
-                "span[aria-label*='stars']"
-            ]
-            
-            for selector in rating_selectors:
+            for selector in table['rating']:
                 try:
-                    rating_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    rating_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                     if rating_elements:
                         rating_text = rating_elements[0].text.strip()
                         if rating_text and any(char.isdigit() for char in rating_text):
-                            # Extract rating and review count
-                            if '(' in rating_text:
-                                parts = rating_text.split('(')
-                                business_data['rating'] = parts[0].strip()
-                                if len(parts) > 1:
-                                    business_data['total_reviews'] = parts[1].replace(')', '').strip()
-                            else:
-                                business_data['rating'] = rating_text
-                            break
-                except:
-                    continue
-            
-            # Category
-            category_selectors = [
-                ".DkEaL",
-                ".mgr77e .fontBodyMedium",
-                "[data-value='Category']",
-                ".AeaXub .fontBodyMedium",
-                "button[jsaction*='category']"
-            ]
-            
-            for selector in category_selectors:
-                try:
-                    category_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if category_elements:
-                        category_text = category_elements[0].text.strip()
-                        if category_text:
-                            business_data['category'] = category_text
+                            business_data['rating'], business_data['total_reviews'] = split_rating(rating_text)
+                            matched['rating'] = selector
                             break
                 except:
                     continue
@@ -382,52 +686,42 @@ class GoogleMapsScraper:
         except Exception as e:
             print(f"Error extracting business data: {e}")
         
-        # Debug: Print what we extracted
-        if business_data['name']:
-            print(f"Successfully extracted: {business_data['name']}")
+        self.record_selector_stats(table, matched)
+        return business_data, matched
+    
+    def record_selector_stats(self, table, matched):
+        """Feed which selectors hit or missed into the shared registry"""
+        name_match = matched.get('name')
+        
+        if name_match in table['name']:
+            selector_registry.record_attempts('name', table['name'], name_match)
         else:
-            print("Failed to extract business name")
+            # Primary name selectors all missed; the general fallback was walked
+            selector_registry.record_attempts('name', table['name'], None)
+            selector_registry.record_attempts('name_fallback', table['name_fallback'], name_match)
         
-        return business_data if business_data['name'] and business_data['name'].lower() != 'results' else None
+        for field in ('address', 'phone', 'website', 'rating', 'category'):
+            selector_registry.record_attempts(field, table[field], matched.get(field))
     
     def save_to_excel(self, results, filename=None):
         """Save results to Excel file"""
-        if not results:
-            return None
-            
-        try:
-            if not filename:
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                filename = f"google_maps_results_{timestamp}.xlsx"
-            
-            # Ensure results directory exists
-            os.makedirs("results", exist_ok=True)
-            
-            filepath = os.path.join("results", filename)
-            df = pd.DataFrame(results)
-            df.to_excel(filepath, index=False)
-            return filepath
-        except Exception as e:
-            print(f"Error saving to Excel: {e}")
-            return None
+        return self.save_results(results, "xlsx", filename)
     
     def save_to_csv(self, results, filename=None):
         """Save results to CSV file"""
+        return self.save_results(results, "csv", filename)
+    
+    def save_to_json(self, results, filename=None):
+        """Save results to newline-delimited JSON file"""
+        return self.save_results(results, "json", filename)
+    
+    def save_results(self, results, export_format, filename=None):
+        """Stream results into an export file of the given format"""
         if not results:
             return None
             
         try:
-            if not filename:
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                filename = f"google_maps_results_{timestamp}.csv"
-            
-            # Ensure results directory exists
-            os.makedirs("results", exist_ok=True)
-            
-            filepath = os.path.join("results", filename)
-            df = pd.DataFrame(results)
-            df.to_csv(filepath, index=False)
-            return filepath
+            return export_records(results, export_format, filename, prefix="google_maps_results")
         except Exception as e:
-            print(f"Error saving to CSV: {e}")
+            print(f"Error saving to {export_format.upper()}: {e}")
             return None
\ No newline at end of file
@@ -0,0 +1,103 @@
+# scrapers/maps_feed.py
+"""
+Incremental cursor over the Google Maps results feed
+"""
+
+import re
+from urllib.parse import unquote
+
+FEED_SELECTORS = [
+    "[data-result-index]",
+    ".hfpxzc",
+    "a[href*='/maps/place/']",
+    "[jsaction*='mouseover']"
+]
+
+# Google place id (ChIJ...) and feature id (0x...:0x...) inside /maps/place/ data params
+PLACE_ID_PATTERN = re.compile(r'!19s(ChIJ[\w-]+)')
+FEATURE_ID_PATTERN = re.compile(r'!1s(0x[0-9a-fA-F]+:0x[0-9a-fA-F]+)')
+PLACE_PATH_PATTERN = re.compile(r'/maps/place/([^/?#]+)')
+
+# Returns [element, href, data-result-index, aria-label] for every card in one roundtrip
+COLLECT_CARDS_SCRIPT = """
+var cards = [];
+var nodes = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < nodes.length; i++) {
+    var node = nodes[i];
+    var link = node.matches("a[href*='/maps/place/']") ? node :
+        (node.querySelector("a[href*='/maps/place/']") || node.closest("a[href*='/maps/place/']"));
+    var indexed = node.closest('[data-result-index]');
+    cards.push([
+        node,
+        link ? link.href : '',
+        indexed ? indexed.getAttribute('data-result-index') : '',
+        node.getAttribute('aria-label') || (link && link.getAttribute('aria-label')) || ''
+    ]);
+}
+return cards;
+"""
+
+
+def place_id_from_href(href):
+    """Return a stable identifier for a /maps/place/ link, or '' if none"""
+    if not href:
+        return ''
+    for pattern in (PLACE_ID_PATTERN, FEATURE_ID_PATTERN):
+        match = pattern.search(href)
+        if match:
+            return match.group(1)
+    match = PLACE_PATH_PATTERN.search(href)
+    if match:
+        return 'place:' + unquote(match.group(1)).replace('+', ' ').lower()
+    return ''
+
+
+class FeedCard:
+    """A results feed entry that has not been processed yet"""
+
+    def __init__(self, element, place_id, href):
+        self.element = element
+        self.place_id = place_id
+        self.href = href
+
+
+class FeedCursor:
+    """Track which feed cards were already processed, keyed by place id"""
+
+    def __init__(self, seen=None):
+        self.seen = set(seen or [])
+        self.selector = None
+        self.last_count = 0
+
+    def new_cards(self, driver):
+        """Return cards that appeared since the last call, skipping seen places"""
+        rows = []
+        candidates = [self.selector] + FEED_SELECTORS if self.selector else FEED_SELECTORS
+        for selector in candidates:
+            rows = driver.execute_script(COLLECT_CARDS_SCRIPT, selector) or []
+            if rows:
+                self.selector = selector
+                break
+
+        self.last_count = len(rows)
+        cards = []
+        batch = set()
+        for element, href, result_index, label in rows:
+            place_id = place_id_from_href(href)
+            if not place_id and result_index:
+                place_id = f"index:{result_index}"
+            if not place_id and label:
+                place_id = f"label:{label.strip().lower()}"
+            if not place_id or place_id in self.seen or place_id in batch:
+                continue
+            batch.add(place_id)
+            cards.append(FeedCard(element, place_id, href))
+        return cards
+
+    def mark_seen(self, place_id):
+        """Record a place as processed"""
+        self.seen.add(place_id)
+
+    def is_seen(self, place_id):
+        """Check whether a place was already processed"""
+        return place_id in self.seen
@@ -1,137 +1,254 @@
 # scrapers/phone_scraper.py
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-import pandas as pd
 import time
-import re
 from urllib.parse import quote
-import requests
 from bs4 import BeautifulSoup
 import os
 
+from config.app_config import app_config
+from database.checkpoints import CheckpointStore, JOB_COMPLETED, JOB_FAILED, JOB_STOPPED
+from database.contacts import ContactIndex
+from scrapers.contact_extractors import extract_phones, clean_phone, is_valid_phone, format_phone
+from utils.bloom import seen_urls
+from utils.contact_frontier import ContactFrontier
+from utils.domain_blocklist import domain_blocklist
+from utils.driver_pool import driver_pool
+from utils.export_sinks import export_records, stream_to_sink
+from utils.fetch_engine import AsyncFetchEngine
+from utils.streaming import aiter_in_thread
+from utils.tiered_fetch import TieredFetcher
+from utils.url_tools import dedupe_urls, domain_of
+from utils.waits import wait_for, wait_timeout, network_idle
+
 class PhoneScraper:
     def __init__(self):
         self.driver = None
         self.results = []
         self.phones_found = set()
+        self.fetch_engine = AsyncFetchEngine()
+        self.tiered_fetcher = TieredFetcher(self.fetch_engine)
+        self.checkpoints = CheckpointStore()
+        self.contact_index = ContactIndex() if app_config.CONTACT_INDEX_ENABLED else None
         
     def setup_driver(self, headless=False):
-        """Setup Chrome driver with options"""
-        chrome_options = Options()
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        if headless:
-            chrome_options.add_argument("--headless")
-        
+        """Lease a warm Chrome driver from the shared pool"""
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.driver = driver_pool.acquire(headless=headless)
             return True
         except Exception as e:
             print(f"Error setting up driver: {e}")
             return False
     
-    def scrape(self, query, pages=3, progress_callback=None, stop_callback=None):
+    def release_driver(self):
+        """Return the leased driver to the shared pool"""
+        if self.driver:
+            driver_pool.release(self.driver)
+            self.driver = None
+        
+    def scrape(self, query, pages=3, progress_callback=None, stop_callback=None, sink=None, new_only=None):
         """Scrape phone numbers from Google search results"""
-        self.results = []
+        records = self.iter_scrape(query, pages, progress_callback, stop_callback, new_only=new_only)
+        self.results = list(stream_to_sink(records, sink))
+        return self.results
+    
+    def resume(self, job_id, progress_callback=None, stop_callback=None, sink=None):
+        """Continue an interrupted job; returns its restored and newly found records"""
+        records = self.iter_resume(job_id, progress_callback, stop_callback)
+        self.results = list(stream_to_sink(records, sink))
+        return self.results
+    
+    def iter_resume(self, job_id, progress_callback=None, stop_callback=None):
+        """Yield a checkpointed job's records, then continue scanning where it stopped"""
+        job = self.checkpoints.load_job(job_id)
+        if not job or job.scraper_type != "phone":
+            if progress_callback:
+                progress_callback(f"❌ No phone scraping job #{job_id} to resume")
+            return
+        
+        yield from self.iter_scrape(job.params['query'], job.params['pages'], progress_callback, stop_callback,
+                                    job=job, new_only=job.params.get('new_only'))
+    
+    def iter_scrape(self, query, pages=3, progress_callback=None, stop_callback=None, job=None, new_only=None):
+        """Yield each phone record as soon as it is found"""
         self.phones_found = set()
         
         if not self.setup_driver():
             if progress_callback:
                 progress_callback("❌ Error: Could not setup Chrome driver")
-            return []
+            return
+        
+        # Create the job only once a driver is leased, so a failed setup leaves no "running" job behind
+        if job is None and app_config.CHECKPOINT_ENABLED:
+            job = self.checkpoints.create_job("phone", {'query': query, 'pages': pages, 'new_only': new_only})
+        
+        # Contacts seen by earlier runs are recorded, and dropped in new-only mode
+        contacts = self.contact_index.session("phone", "phone", new_only) if self.contact_index else None
+        
+        found = 0
+        status = JOB_COMPLETED
         
         try:
+            # Replay records saved by an interrupted run of this job
+            if job and job.records:
+                if progress_callback:
+                    progress_callback(f"♻️ Resuming job #{job.job_id} with {len(job.records)} phone numbers already found")
+                for record in job.records:
+                    self.phones_found.add(record['phone'])
+                    found += 1
+                    yield record
+            
             if progress_callback:
                 progress_callback(f"🔍 Searching for: {query}")
             
-            # Search on Google
-            search_url = f"https://www.google.com/search?q={quote(query)}"
-            self.driver.get(search_url)
-            time.sleep(3)
-            
-            # Extract URLs from multiple pages
-            all_urls = []
-            for page in range(pages):
-                # Check for stop signal
-                if stop_callback and stop_callback():
-                    if progress_callback:
-                        progress_callback("Phone scraping stopped by user")
-                    break
-                    
-                if progress_callback:
-                    progress_callback(f"📄 Scraping page {page + 1} of {pages}")
+            # Extract URLs from multiple pages, skipping pages a previous run visited
+            all_urls = list(job.get('urls', [])) if job else []
+            start_page = job.get('serp_pages', 0) if job else 0
+            if start_page < pages and not (job and job.get('serp_complete')):
+                search_url = f"https://www.google.com/search?q={quote(query)}"
+                if start_page:
+                    search_url += f"&start={start_page * 10}"
+                self.driver.get(search_url)
+                time.sleep(3)
                 
-                urls = self.extract_urls_from_page()
-                all_urls.extend(urls)
-                
-                # Go to next page
-                if page < pages - 1:
-                    try:
-                        next_button = self.driver.find_element(By.ID, "pnnext")
-                        next_button.click()
-                        time.sleep(3)
-                    except:
+                for page in range(start_page, pages):
+                    # Check for stop signal
+                    if stop_callback and stop_callback():
                         if progress_callback:
-                            progress_callback(f"⚠️ No more pages available (stopped at page {page + 1})")
+                            progress_callback("Phone scraping stopped by user")
                         break
+                        
+                    if progress_callback:
+                        progress_callback(f"📄 Scraping page {page + 1} of {pages}")
+                    
+                    urls = self.extract_urls_from_page()
+                    all_urls = dedupe_urls(all_urls + urls)
+                    
+                    if job:
+                        # SERP pages are the most expensive step, so save each one right away
+                        job.set('urls', all_urls)
+                        job.set('serp_pages', page + 1)
+                        job.flush()
+                    
+                    # Go to next page
+                    if page < pages - 1:
+                        try:
+                            next_button = self.driver.find_element(By.ID, "pnnext")
+                            next_button.click()
+                            time.sleep(3)
+                        except:
+                            if progress_callback:
+                                progress_callback(f"⚠️ No more pages available (stopped at page {page + 1})")
+                            if job:
+                                job.set('serp_complete', True)
+                            break
+            
+            # URLs already scanned by an interrupted run are not fetched again
+            scanned = job.item_set('scanned') if job else set()
+            pending_urls = [url for url in all_urls if url not in scanned]
             
             if progress_callback:
                 progress_callback(f"📎 Found {len(all_urls)} URLs to scan for phone numbers")
+                if len(pending_urls) < len(all_urls):
+                    progress_callback(f"⏭️ Skipping {len(all_urls) - len(pending_urls)} URLs scanned before the interruption")
             
-            # Extract phone numbers from each URL
-            for i, url in enumerate(all_urls):
+            # Pages scanned by recent runs are skipped in constant time
+            if app_config.SEEN_URL_FILTER_ENABLED:
+                unseen_urls = seen_urls.filter_new(pending_urls)
+                if progress_callback and len(unseen_urls) < len(pending_urls):
+                    progress_callback(f"⏭️ Skipping {len(pending_urls) - len(unseen_urls)} URLs scanned in recent runs")
+                pending_urls = unseen_urls
+            
+            # Fetch result pages concurrently, then follow likely contact links on sites without phone numbers
+            frontier = ContactFrontier(done_sites=job.item_set('done_site') if job else None)
+            frontier.add_seeds(pending_urls)
+            scanned_results = 0
+            # Extraction runs in worker processes while the next pages download
+            for page, phones in frontier.stream(self.tiered_fetcher, self.render_page, stop_callback, extract_phones):
                 # Check for stop signal
                 if stop_callback and stop_callback():
-                    if progress_callback:
-                        progress_callback("Phone scraping stopped by user")
                     break
-                    
+                
+                url = page.url
+                depth = frontier.depth_of(url)
                 if progress_callback:
-                    progress_callback(f"🔍 Scanning URL {i + 1}/{len(all_urls)}: {url[:50]}...")
+                    if depth:
+                        progress_callback(f"🔗 Following contact link (depth {depth}): {url[:50]}...")
+                    else:
+                        scanned_results += 1
+                        progress_callback(f"🔍 Scanning URL {scanned_results}/{len(pending_urls)}: {url[:50]}...")
                 
-                phones = self.extract_phones_from_url(url)
-                if phones:
-                    for phone in phones:
-                        if phone not in self.phones_found:
-                            self.phones_found.add(phone)
-                            self.results.append({
-                                'phone': phone,
-                                'formatted_phone': self.format_phone(phone),
-                                'source_url': url,
-                                'found_at': time.strftime("%Y-%m-%d %H:%M:%S")
-                            })
-                            
-                            if progress_callback:
-                                progress_callback(f"📞 Found phone: {phone}")
+                frontier.page_done(page, bool(phones))
+                if page.ok:
+                    # Failed fetches stay eligible for the next run
+                    seen_urls.add(url)
+                fresh = [phone for phone in phones if phone not in self.phones_found]
+                self.phones_found.update(fresh)
+                if contacts:
+                    fresh = contacts.filter_new(fresh, url)
+                new_records = [{
+                    'phone': phone,
+                    'formatted_phone': self.format_phone(phone),
+                    'source_url': url,
+                    'found_at': time.strftime("%Y-%m-%d %H:%M:%S")
+                } for phone in fresh]
+                
+                if job:
+                    # A URL counts as scanned together with the records it produced
+                    for record in new_records:
+                        job.record(record)
+                    job.add('scanned', url)
+                    if frontier.is_done(url):
+                        job.add('done_site', domain_of(url))
+                    job.maybe_flush()
                 
-                # Small delay to avoid being blocked
-                time.sleep(1)
+                for record in new_records:
+                    found += 1
+                    if progress_callback:
+                        progress_callback(f"📞 Found phone: {record['phone']}")
+                    yield record
             
-            if not stop_callback or not stop_callback():
+            if progress_callback and pending_urls:
+                progress_callback(self.tiered_fetcher.describe())
+                if contacts and contacts.skipped:
+                    progress_callback(f"⏭️ Skipped {contacts.skipped} contacts already found by earlier runs")
+                if frontier.followed:
+                    progress_callback(f"🔗 Followed {frontier.followed} contact links; contacts found on {len(frontier.done_sites)} sites")
+                if self.fetch_engine.cache:
+                    progress_callback(self.fetch_engine.cache.describe())
+            
+            if stop_callback and stop_callback():
+                status = JOB_STOPPED
+                if progress_callback:
+                    progress_callback("Phone scraping stopped by user")
+            else:
                 if progress_callback:
-                    progress_callback(f"✅ Phone scraping completed! Found {len(self.results)} unique phone numbers")
+                    progress_callback(f"✅ Phone scraping completed! Found {found} unique phone numbers")
                 
         except Exception as e:
+            status = JOB_FAILED
             if progress_callback:
                 progress_callback(f"❌ Error during scraping: {str(e)}")
+        except GeneratorExit:
+            status = JOB_STOPPED
+            raise
         finally:
-            if self.driver:
-                self.driver.quit()
-                
-        return self.results
+            self.release_driver()
+            seen_urls.save()
+            if contacts:
+                contacts.flush()
+            if job:
+                job.finish(status)
+                if status != JOB_COMPLETED and progress_callback:
+                    progress_callback(f"💾 Progress saved; resume with job #{job.job_id}")
+    
+    async def aiter_scrape(self, query, pages=3, progress_callback=None, stop_callback=None, new_only=None):
+        """Async variant of iter_scrape; the scrape runs on a worker thread"""
+        async for record in aiter_in_thread(
+                self.iter_scrape, query, pages, progress_callback, stop_callback=stop_callback, new_only=new_only):
+            yield record
     
     def extract_urls_from_page(self):
         """Extract URLs from current Google search results page"""
@@ -151,202 +268,70 @@ class PhoneScraper:
         except Exception as e:
             print(f"Error extracting URLs: {e}")
             
-        return list(set(urls))  # Remove duplicates
+        return dedupe_urls(urls)  # Canonicalize and remove duplicates
     
     def is_valid_url(self, url):
         """Check if URL is valid for phone extraction"""
         if not url or not url.startswith('http'):
             return False
             
-        # Skip Google's own URLs and some social media
-        skip_domains = [
-            'google.com', 'youtube.com', 'facebook.com', 'twitter.com',
-            'linkedin.com', 'instagram.com', 'pinterest.com'
-        ]
-        
-        for domain in skip_domains:
-            if domain in url:
-                return False
-                
-        return True
+        # Skip search engines, social networks and directories (config/blocked_domains.txt)
+        return not domain_blocklist.blocks(url)
     
     def extract_phones_from_url(self, url):
         """Extract phone numbers from a specific URL"""
-        phones = []
+        for page in self.tiered_fetcher.stream([url], self.render_page):
+            return self.extract_phones_from_html(page.html)
+        return []
+    
+    def render_page(self, url):
+        """Load a page in Chrome for content that needs JavaScript"""
+        if not self.driver:
+            return ""
         
         try:
-            # First try with Selenium
             self.driver.get(url)
-            time.sleep(3)
-            page_source = self.driver.page_source
-            
-            # Extract phone numbers using multiple regex patterns
-            phone_patterns = [
-                # US formats with country code
-                r'\+1[\s\-\.]?\(?([0-9]{3})\)?[\s\-\.]?([0-9]{3})[\s\-\.]?([0-9]{4})\b',
-                # US formats without country code
-                r'\(?([0-9]{3})\)?[\s\-\.]?([0-9]{3})[\s\-\.]?([0-9]{4})\b',
-                # International formats
-                r'\+[1-9]\d{1,14}\b',
-                # General patterns
-                r'\b\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}\b',
-                # Pattern with parentheses
-                r'\(\d{3}\)[\s\-]?\d{3}[\s\-]?\d{4}',
-                # Indian mobile numbers
-                r'\+91[\s\-]?\d{10}',
-                r'\b[6-9]\d{9}\b'
-            ]
-            
-            found_phones = set()
-            for pattern in phone_patterns:
-                matches = re.findall(pattern, page_source)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        # Join tuple elements for US format
-                        phone_str = ''.join(match)
-                    else:
-                        phone_str = match
-                    
-                    # Clean and validate
-                    cleaned_phone = self.clean_phone(phone_str)
-                    if self.is_valid_phone(cleaned_phone):
-                        found_phones.add(cleaned_phone)
-            
-            phones.extend(list(found_phones))
-                        
+            wait_for(self.driver, network_idle(), wait_timeout("network_idle"))
+            return self.driver.page_source
         except Exception as e:
-            # If Selenium fails, try with requests
-            try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                }
-                response = requests.get(url, headers=headers, timeout=15)
-                if response.status_code == 200:
-                    # Use the same patterns as above
-                    phone_patterns = [
-                        r'\+1[\s\-\.]?\(?([0-9]{3})\)?[\s\-\.]?([0-9]{3})[\s\-\.]?([0-9]{4})\b',
-                        r'\(?([0-9]{3})\)?[\s\-\.]?([0-9]{3})[\s\-\.]?([0-9]{4})\b',
-                        r'\+[1-9]\d{1,14}\b',
-                        r'\b\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}\b'
-                    ]
-                    
-                    found_phones = set()
-                    for pattern in phone_patterns:
-                        matches = re.findall(pattern, response.text)
-                        for match in matches:
-                            phone_str = ''.join(match) if isinstance(match, tuple) else match
-                            cleaned_phone = self.clean_phone(phone_str)
-                            if self.is_valid_phone(cleaned_phone):
-                                found_phones.add(cleaned_phone)
-                    
-                    phones.extend(list(found_phones))
-            except Exception as req_error:
-                pass
-        
-        return list(set(phones))  # Remove duplicates
+            print(f"Error rendering {url}: {e}")
+            return ""
+    
+    def extract_phones_from_html(self, page_source):
+        """Extract phone numbers from page source"""
+        return extract_phones(page_source)
     
     def clean_phone(self, phone):
         """Clean phone number string"""
-        if not phone:
-            return ""
-        
-        # Remove all non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', str(phone))
-        
-        # Handle US numbers
-        if cleaned.startswith('1') and len(cleaned) == 11:
-            cleaned = cleaned[1:]  # Remove leading 1
-        elif cleaned.startswith('+1') and len(cleaned) == 12:
-            cleaned = cleaned[2:]  # Remove +1
-        
-        return cleaned
+        return clean_phone(phone)
     
     def is_valid_phone(self, phone):
         """Validate phone number"""
-        if not phone:
-            return False
-        
-        # Remove any remaining non-digits
-        digits_only = re.sub(r'\D', '', phone)
-        
-        # Check length (allow 10-15 digits for international numbers)
-        if len(digits_only) < 10 or len(digits_only) > 15:
-            return False
-        
-        # For 10-digit numbers (US format)
-        if len(digits_only) == 10:
-            # First digit should not be 0 or 1
-            if digits_only[0] in ['0', '1']:
-                return False
-        
-        # For 11-digit numbers (US with country code)
-        if len(digits_only) == 11:
-            # Should start with 1 for US
-            if not digits_only.startswith('1'):
-                return False
-            # Area code (2nd-4th digits) should not start with 0 or 1
-            if digits_only[1] in ['0', '1']:
-                return False
-        
-        # Check for obviously invalid patterns
-        invalid_patterns = [
-            '0000000000', '1111111111', '2222222222', '3333333333',
-            '4444444444', '5555555555', '6666666666', '7777777777',
-            '8888888888', '9999999999', '1234567890', '0123456789',
-            '9876543210'
-        ]
-        
-        # Check against 10-digit version for invalid patterns
-        check_digits = digits_only[-10:] if len(digits_only) > 10 else digits_only
-        if check_digits in invalid_patterns:
-            return False
-        
-        return True
+        return is_valid_phone(phone)
     
     def format_phone(self, phone):
         """Format phone number for display"""
-        digits = re.sub(r'\D', '', phone)
-        if len(digits) == 10:
-            return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-        elif len(digits) == 11 and digits[0] == '1':
-            return f"+1 ({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
-        else:
-            return phone
+        return format_phone(phone)
     
     def save_to_excel(self, results, filename=None):
         """Save results to Excel file"""
-        if not results:
-            return None
-            
-        try:
-            if not filename:
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                filename = f"phone_scraper_results_{timestamp}.xlsx"
-            
-            os.makedirs("results", exist_ok=True)
-            filepath = os.path.join("results", filename)
-            df = pd.DataFrame(results)
-            df.to_excel(filepath, index=False)
-            return filepath
-        except Exception as e:
-            print(f"Error saving to Excel: {e}")
-            return None
+        return self.save_results(results, "xlsx", filename)
     
     def save_to_csv(self, results, filename=None):
         """Save results to CSV file"""
+        return self.save_results(results, "csv", filename)
+    
+    def save_to_json(self, results, filename=None):
+        """Save results to newline-delimited JSON file"""
+        return self.save_results(results, "json", filename)
+    
+    def save_results(self, results, export_format, filename=None):
+        """Stream results into an export file of the given format"""
         if not results:
             return None
             
         try:
-            if not filename:
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                filename = f"phone_scraper_results_{timestamp}.csv"
-            
-            os.makedirs("results", exist_ok=True)
-            filepath = os.path.join("results", filename)
-            df = pd.DataFrame(results)
-            df.to_csv(filepath, index=False)
-            return filepath
+            return export_records(results, export_format, filename, prefix="phone_scraper_results")
         except Exception as e:
-            print(f"Error saving to CSV: {e}")
+            print(f"Error saving to {export_format.upper()}: {e}")
             return None
\ No newline at end of file
@@ -0,0 +1,147 @@
+# utils/bloom.py
+"""
+Compact probabilistic sets for skipping URLs scanned in recent runs
+"""
+
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+
+from config.app_config import app_config
+from utils.url_tools import url_key
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter with double hashing over blake2b"""
+
+    def __init__(self, capacity, error_rate, bits=None, count=0, created=None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bits if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = count
+        self.created = created or time.time()
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, item):
+        """Add item; returns False if it was (probably) present already"""
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, item):
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                return False
+        return True
+
+    def is_full(self):
+        return self.count >= self.capacity
+
+
+class SeenUrlFilter:
+    """Two rotating Bloom generations of recently scanned URLs, persisted under DATA_DIR.
+
+    A generation is retired after half the TTL or once full, so a URL is
+    remembered for between TTL/2 and TTL while the false-positive rate stays
+    at the configured bound.
+    """
+
+    def __init__(self, path=None, capacity=None, error_rate=None, ttl=None):
+        self.path = path or os.path.join(app_config.DATA_DIR, "seen_urls.bloom")
+        self.capacity = capacity or app_config.SEEN_URL_CAPACITY
+        self.error_rate = error_rate or app_config.SEEN_URL_ERROR_RATE
+        self.ttl = app_config.SEEN_URL_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.current, self.previous = self.load()
+
+    def new_generation(self):
+        return BloomFilter(self.capacity, self.error_rate)
+
+    def load(self):
+        """Load both generations; a missing or incompatible file starts empty"""
+        try:
+            with open(self.path, 'rb') as f:
+                header = json.loads(f.readline())
+                data = f.read()
+        except (OSError, ValueError):
+            return self.new_generation(), None
+
+        generations = []
+        offset = 0
+        for meta in header.get('generations', []):
+            template = self.new_generation()
+            length = len(template.bits)
+            if meta.get('capacity') != self.capacity or meta.get('error_rate') != self.error_rate:
+                return self.new_generation(), None
+            generations.append(BloomFilter(self.capacity, self.error_rate, bytearray(data[offset:offset + length]),
+                                           meta.get('count', 0), meta.get('created')))
+            offset += length
+
+        generations = [g for g in generations if time.time() - g.created < self.ttl]
+        if not generations:
+            return self.new_generation(), None
+        return generations[0], generations[1] if len(generations) > 1 else None
+
+    def save(self):
+        """Persist both generations atomically"""
+        with self._lock:
+            if not self._dirty:
+                return
+            generations = [g for g in (self.current, self.previous) if g is not None]
+            header = {'generations': [{'capacity': g.capacity, 'error_rate': g.error_rate,
+                                       'count': g.count, 'created': g.created} for g in generations]}
+            payload = b''.join(bytes(g.bits) for g in generations)
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b"\n")
+                f.write(payload)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Error saving seen URL filter: {e}")
+
+    def _rotate(self):
+        if self.current.is_full() or time.time() - self.current.created >= self.ttl / 2:
+            self.previous = self.current
+            self.current = self.new_generation()
+
+    def add(self, url):
+        """Remember url as scanned"""
+        key = url_key(url)
+        with self._lock:
+            self._rotate()
+            self.current.add(key)
+            self._dirty = True
+
+    def __contains__(self, url):
+        key = url_key(url)
+        with self._lock:
+            return key in self.current or (self.previous is not None and key in self.previous)
+
+    def filter_new(self, urls):
+        """Return urls not scanned recently"""
+        return [url for url in urls if url not in self]
+
+
+# Shared filter used by the contact scrapers
+seen_urls = SeenUrlFilter()
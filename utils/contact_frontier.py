@@ -0,0 +1,160 @@
+# utils/contact_frontier.py
+"""
+Prioritized frontier that follows likely contact pages a level or two into each site
+"""
+
+import heapq
+import re
+from urllib.parse import urljoin, urlsplit
+
+from config.app_config import app_config
+from utils.extraction_pool import extraction_pool
+from utils.url_tools import canonicalize_url, domain_of
+
+LINK_PATTERN = re.compile(r'<a\b[^>]*?\bhref\s*=\s*["\']([^"\'#][^"\']*)["\'][^>]*>(.*?)</a\s*>', re.I | re.S)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WORD_SPLIT_PATTERN = re.compile(r'[^a-z0-9äöüéèàç]+')
+
+# Weight of a keyword in anchor text or URL path; highest match wins
+CONTACT_KEYWORDS = {
+    'contact': 1.0, 'contacts': 1.0, 'contactus': 1.0, 'kontakt': 1.0, 'contacto': 1.0,
+    'contatti': 1.0, 'contactez': 1.0, 'touch': 0.8, 'reach': 0.6, 'enquiry': 0.8, 'enquiries': 0.8,
+    'impressum': 0.95, 'imprint': 0.9, 'mentions': 0.6, 'legal': 0.5,
+    'about': 0.6, 'aboutus': 0.6, 'ueber': 0.6, 'uber': 0.5, 'nosotros': 0.6, 'chi': 0.3,
+    'team': 0.5, 'staff': 0.5, 'people': 0.4, 'leadership': 0.4,
+    'locations': 0.4, 'location': 0.4, 'office': 0.4, 'offices': 0.4, 'support': 0.3, 'help': 0.2
+}
+# Links that never carry contact details
+SKIP_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.zip', '.mp4', '.mp3',
+                   '.doc', '.docx', '.xls', '.xlsx', '.css', '.js', '.xml', '.ico')
+SKIP_SCHEMES = ('mailto:', 'tel:', 'javascript:', 'data:', 'sms:', 'whatsapp:')
+
+
+def keyword_score(text):
+    """Best keyword weight among the words of text"""
+    best = 0.0
+    for word in WORD_SPLIT_PATTERN.split(text.lower()):
+        best = max(best, CONTACT_KEYWORDS.get(word, 0.0))
+    return best
+
+
+def score_link(href, anchor_text):
+    """Cheap likelihood that a link leads to contact details, 0..1"""
+    path = urlsplit(href).path
+    anchor_score = keyword_score(anchor_text)
+    path_score = keyword_score(path) * 0.9
+    score = max(anchor_score, path_score)
+    if anchor_score and path_score:
+        score += 0.1
+    # Deep paths are usually articles rather than site-level pages
+    segments = [segment for segment in path.split('/') if segment]
+    score -= 0.05 * max(0, len(segments) - 1)
+    return round(min(score, 1.0), 3)
+
+
+def contact_links(html, base_url):
+    """Return [(score, url)] for same-site links worth following, best first"""
+    site = domain_of(base_url)
+    best = {}
+    for href, anchor in LINK_PATTERN.findall(html or ''):
+        href = href.strip()
+        if href.lower().startswith(SKIP_SCHEMES):
+            continue
+        url = canonicalize_url(urljoin(base_url, href))
+        if not url.startswith('http') or domain_of(url) != site:
+            continue
+        if urlsplit(url).path.lower().endswith(SKIP_EXTENSIONS):
+            continue
+        score = score_link(url, TAG_PATTERN.sub(' ', anchor))
+        if score > best.get(url, 0.0):
+            best[url] = score
+    return sorted(((score, url) for url, score in best.items()), reverse=True)
+
+
+class ContactFrontier:
+    """Seed URLs plus scored same-site links, fetched in waves by depth"""
+
+    def __init__(self, max_depth=None, site_budget=None, done_sites=None):
+        self.max_depth = app_config.CONTACT_CRAWL_DEPTH if max_depth is None else max_depth
+        self.site_budget = site_budget or app_config.CONTACT_SITE_PAGE_BUDGET
+        self.min_score = app_config.CONTACT_LINK_MIN_SCORE
+        self.links_per_page = app_config.CONTACT_LINKS_PER_PAGE
+        self.done_sites = set(done_sites or [])
+        self._seeds = []
+        self._heap = []
+        self._seq = 0
+        self._depth = {}
+        self._pages = {}  # site -> pages fetched or queued
+        self.followed = 0  # Linked pages fetched beyond the seeds
+
+    def add_seeds(self, urls):
+        """Queue search result URLs at depth 0"""
+        for url in urls:
+            if url not in self._depth:
+                self._depth[url] = 0
+                self._seeds.append(url)
+
+    def depth_of(self, url):
+        return self._depth.get(url, 0)
+
+    def is_done(self, url):
+        """True once a site produced contacts; its remaining URLs are skipped"""
+        return domain_of(url) in self.done_sites
+
+    def page_done(self, page, found_contacts):
+        """Record a fetched page; close its site or queue its best contact links"""
+        site = domain_of(page.url)
+        depth = self.depth_of(page.url)
+        if depth:
+            self.followed += 1
+        if found_contacts:
+            self.done_sites.add(site)
+            return
+        if depth >= self.max_depth or site in self.done_sites:
+            return
+        queued = 0
+        for score, url in contact_links(page.html, page.url):
+            if queued >= self.links_per_page or score < self.min_score:
+                break
+            if url in self._depth:
+                continue
+            self._depth[url] = depth + 1
+            self._seq += 1
+            heapq.heappush(self._heap, (-score, self._seq, url))
+            queued += 1
+
+    def next_wave(self):
+        """Take the next batch: seeds first, then the best links within each site's budget"""
+        if self._seeds:
+            wave = [url for url in self._seeds if not self.is_done(url)]
+            self._seeds = []
+            for url in wave:
+                site = domain_of(url)
+                self._pages[site] = self._pages.get(site, 0) + 1
+            return wave
+
+        wave = []
+        while self._heap:
+            _, _, url = heapq.heappop(self._heap)
+            site = domain_of(url)
+            if site in self.done_sites or self._pages.get(site, 0) >= self.site_budget:
+                continue
+            self._pages[site] = self._pages.get(site, 0) + 1
+            wave.append(url)
+        return wave
+
+    def stream(self, tiered_fetcher, render, stop_callback=None, extractor=None):
+        """Yield pages wave by wave; call page_done() for each page before asking for the next.
+
+        With an extractor, yield (page, extractor(page.html)) with extraction run in the shared process pool.
+        """
+        wave = self.next_wave()
+        while wave:
+            pages = tiered_fetcher.stream(wave, render, stop_callback, skip_callback=self.is_done)
+            if extractor is not None:
+                pages = extraction_pool.stream(pages, extractor)
+            for page in pages:
+                yield page
+            if stop_callback and stop_callback():
+                return
+            wave = self.next_wave()
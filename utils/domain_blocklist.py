@@ -0,0 +1,85 @@
+# utils/domain_blocklist.py
+"""
+Aggregator, directory and social domains the scrapers never treat as business sites
+"""
+
+import os
+
+from config.app_config import app_config
+from utils.url_tools import host_of
+
+
+def normalize_domain(domain):
+    """Lowercase ASCII form of a blocklist entry; '*.example.com' and '.example.com' mean example.com"""
+    domain = domain.strip().lower().lstrip('*').strip('.')
+    if domain.isascii():
+        return domain
+    try:
+        return domain.encode('idna').decode('ascii')
+    except UnicodeError:
+        return domain
+
+
+def read_domains(path):
+    """Yield domains from a file with one domain per line and # comments"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                domain = normalize_domain(line.split()[-1])
+                if domain:
+                    yield domain
+
+
+class DomainBlocklist:
+    """Blocked and allowed domains held as hashed suffix sets.
+
+    A domain entry covers all of its subdomains. A host is checked from its
+    most specific suffix up, one set lookup per label, so the first matching
+    entry decides and an allowlisted subdomain (sites.google.com) wins over a
+    blocked parent (google.com).
+    """
+
+    def __init__(self, blocked_files=None, allowed_files=None):
+        self.blocked_files = app_config.DOMAIN_BLOCKLIST_FILES if blocked_files is None else blocked_files
+        self.allowed_files = app_config.DOMAIN_ALLOWLIST_FILES if allowed_files is None else allowed_files
+        self.load()
+
+    @staticmethod
+    def read_files(paths):
+        domains = set()
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            try:
+                domains.update(read_domains(path))
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error reading domain list {path}: {e}")
+        return frozenset(domains)
+
+    def load(self):
+        """(Re)load every blocklist and allowlist file"""
+        self.blocked = self.read_files(self.blocked_files)
+        self.allowed = self.read_files(self.allowed_files)
+
+    def blocks_host(self, host):
+        """True if host or its closest listed parent domain is blocked"""
+        labels = normalize_domain(host or '').split('.')
+        for start in range(len(labels)):
+            suffix = '.'.join(labels[start:])
+            if suffix in self.allowed:
+                return False
+            if suffix in self.blocked:
+                return True
+        return False
+
+    def blocks(self, url):
+        """True if url's host is blocked"""
+        return self.blocks_host(host_of(url))
+
+    def __len__(self):
+        return len(self.blocked)
+
+
+# Shared blocklist used by every scraper
+domain_blocklist = DomainBlocklist()
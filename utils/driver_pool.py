@@ -0,0 +1,276 @@
+# utils/driver_pool.py
+"""
+Pool of warm Chrome sessions shared by the scrapers
+"""
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from config.app_config import app_config
+from utils.driver_resolver import chromedriver_resolver
+
+
+def build_chrome_options(headless=False):
+    """Build the Chrome options used by every scraper"""
+    chrome_options = Options()
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument(f"--user-agent={app_config.USER_AGENT}")
+
+    if headless:
+        chrome_options.add_argument("--headless")
+
+    return chrome_options
+
+
+def origin_of(url):
+    """scheme://host[:port] of an http(s) URL, or None"""
+    parts = urlsplit(url or '')
+    if parts.scheme in ('http', 'https') and parts.netloc:
+        return f"{parts.scheme}://{parts.netloc.rpartition('@')[2].lower()}"
+    return None
+
+
+def create_driver(headless=False):
+    """Start a new Chrome session"""
+    service = Service(chromedriver_resolver.resolve())
+    driver = webdriver.Chrome(service=service, options=build_chrome_options(headless))
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+class PooledDriver:
+    """Bookkeeping for a single Chrome session owned by the pool"""
+
+    def __init__(self, driver, headless):
+        self.driver = driver
+        self.headless = headless
+        self.uses = 0
+        self.created_at = time.time()
+
+
+class DriverPool:
+    """Lease warm Chrome sessions instead of starting one per scrape"""
+
+    def __init__(self, size=None, max_uses=None, lease_timeout=None):
+        self.size = max(1, int(size or app_config.MAX_CONCURRENT_SCRAPERS))
+        self.max_uses = max_uses or app_config.DRIVER_MAX_USES
+        self.lease_timeout = lease_timeout or app_config.DRIVER_LEASE_TIMEOUT
+        self._idle = []
+        self._leased = {}
+        self._total = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, headless=False, timeout=None):
+        """Lease a healthy driver, starting one if the pool has room"""
+        timeout = self.lease_timeout if timeout is None else timeout
+        deadline = time.time() + timeout
+        entry = None
+        evicted = None
+
+        with self._condition:
+            while True:
+                entry = self._pop_idle(headless)
+                if entry:
+                    break
+
+                if self._total < self.size:
+                    self._total += 1
+                    break
+
+                # Pool is full but an idle driver has the wrong mode - replace it
+                if self._idle:
+                    evicted = self._idle.pop(0)
+                    break
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"No Chrome driver available after {timeout}s")
+                self._condition.wait(remaining)
+
+        if evicted:
+            self._quit(evicted.driver)
+
+        if entry and not self.is_healthy(entry.driver):
+            self._quit(entry.driver)
+            entry = None
+
+        if entry is None:
+            try:
+                entry = PooledDriver(create_driver(headless), headless)
+            except Exception:
+                with self._condition:
+                    self._total -= 1
+                    self._condition.notify()
+                raise
+
+        entry.uses += 1
+        with self._condition:
+            self._leased[id(entry.driver)] = entry
+        return entry.driver
+
+    def release(self, driver, discard=False):
+        """Return a leased driver, recycling it when worn out or broken"""
+        with self._condition:
+            entry = self._leased.pop(id(driver), None)
+
+        if entry is None:
+            self._quit(driver)
+            return
+
+        keep = not discard and entry.uses < self.max_uses and self.reset_driver(driver)
+
+        with self._condition:
+            if keep:
+                self._idle.append(entry)
+            else:
+                self._total -= 1
+            self._condition.notify()
+
+        if not keep:
+            self._quit(driver)
+
+    @contextmanager
+    def lease(self, headless=False, timeout=None):
+        """Context manager around acquire/release"""
+        driver = self.acquire(headless=headless, timeout=timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not self.is_healthy(driver)
+            raise
+        finally:
+            self.release(driver, discard=broken)
+
+    def is_healthy(self, driver):
+        """Check that the browser and chromedriver still respond"""
+        try:
+            return bool(driver.window_handles) and driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def reset_driver(self, driver):
+        """Clear tabs, cookies and storage so the next lease starts clean"""
+        try:
+            handles = driver.window_handles
+            origins = set()
+            for handle in handles:
+                driver.switch_to.window(handle)
+                origins.update(self.tab_origins(driver))
+                if handle != handles[0]:
+                    driver.close()
+            driver.switch_to.window(handles[0])
+
+            try:
+                driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+            except Exception:
+                pass
+
+            origins.update(self.cookie_origins(driver))
+            driver.delete_all_cookies()
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception as e:
+                print(f"Error clearing browser cookies: {e}")
+            self.clear_origins(driver, origins)
+
+            driver.get("about:blank")
+            try:
+                driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+            except Exception as e:
+                print(f"Error resetting navigation history: {e}")
+            return True
+        except Exception as e:
+            print(f"Error resetting driver: {e}")
+            return False
+
+    @staticmethod
+    def tab_origins(driver):
+        """Origins the current tab visited during the lease, from its history and frames"""
+        urls = []
+        try:
+            history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+            urls.extend(entry.get('url') for entry in history.get('entries', []))
+            frames = [driver.execute_cdp_cmd("Page.getFrameTree", {}).get('frameTree', {})]
+            while frames:
+                node = frames.pop()
+                urls.append(node.get('frame', {}).get('url'))
+                frames.extend(node.get('childFrames', []))
+        except Exception as e:
+            print(f"Error reading visited origins: {e}")
+        return {origin for origin in map(origin_of, urls) if origin}
+
+    @staticmethod
+    def cookie_origins(driver):
+        """Origins of every cookie domain, including third-party ones"""
+        try:
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get('cookies', [])
+        except Exception as e:
+            print(f"Error reading cookies: {e}")
+            return set()
+        domains = {cookie.get('domain', '').lstrip('.') for cookie in cookies}
+        return {f"{scheme}://{domain}" for domain in domains if domain for scheme in ('http', 'https')}
+
+    @staticmethod
+    def clear_origins(driver, origins):
+        """Clear every kind of storage for each origin"""
+        for origin in sorted(origins):
+            try:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            except Exception as e:
+                print(f"Error clearing storage for {origin}: {e}")
+
+    def close_all(self):
+        """Quit every idle driver and forget leased ones"""
+        with self._condition:
+            entries = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+            self._total = 0
+            self._condition.notify_all()
+
+        for entry in entries:
+            self._quit(entry.driver)
+
+    def free_slots(self):
+        """Number of drivers that could be leased right now without waiting"""
+        with self._condition:
+            return max(0, self.size - self._total + len(self._idle))
+
+    def stats(self):
+        """Return current pool occupancy"""
+        with self._condition:
+            return {
+                'size': self.size,
+                'started': self._total,
+                'idle': len(self._idle),
+                'leased': len(self._leased)
+            }
+
+    def _pop_idle(self, headless):
+        for index, entry in enumerate(self._idle):
+            if entry.headless == headless:
+                return self._idle.pop(index)
+        return None
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+# Shared pool used by all scrapers
+driver_pool = DriverPool()
+atexit.register(driver_pool.close_all)
@@ -0,0 +1,133 @@
+# utils/driver_resolver.py
+"""
+Resolve the chromedriver binary once per Chrome version and cache it offline
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+from config.app_config import app_config
+
+VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+
+def detect_chrome_version():
+    """Return the installed Chrome version string, or None if not found"""
+    if sys.platform.startswith('win'):
+        try:
+            import winreg
+            for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                try:
+                    with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                        version, _ = winreg.QueryValueEx(key, "version")
+                        if version:
+                            return version
+                except OSError:
+                    continue
+        except ImportError:
+            pass
+        return None
+
+    if sys.platform == 'darwin':
+        commands = [["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"]]
+    else:
+        commands = [[name, "--version"] for name in
+                    ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")]
+
+    for command in commands:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = VERSION_PATTERN.search(output or "")
+        if match:
+            return match.group(0)
+
+    return None
+
+
+def major_version(version):
+    """Return the major part of a Chrome version string"""
+    return version.split('.')[0] if version else None
+
+
+class ChromeDriverResolver:
+    """Match chromedriver to the installed Chrome and remember the result"""
+
+    def __init__(self, manifest_path=None):
+        self.manifest_path = manifest_path or os.path.join(app_config.DATA_DIR, "chromedriver_manifest.json")
+        self._resolved_path = None
+        self._lock = threading.Lock()
+
+    def load_manifest(self):
+        """Load the cached resolution, if any"""
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self, manifest):
+        """Write the cached resolution"""
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+            with open(self.manifest_path, 'w') as f:
+                json.dump(manifest, f, indent=2)
+        except Exception as e:
+            print(f"Error saving chromedriver manifest: {e}")
+
+    def resolve(self, refresh=False):
+        """Return a chromedriver path, touching the network only when Chrome changed"""
+        with self._lock:
+            if self._resolved_path and not refresh:
+                return self._resolved_path
+
+            override = os.environ.get("SCRAPEON_CHROMEDRIVER") or app_config.CHROMEDRIVER_PATH
+            if override and os.path.exists(override):
+                self._resolved_path = override
+                return override
+
+            manifest = self.load_manifest()
+            chrome_version = detect_chrome_version()
+            cached_path = manifest.get("driver_path")
+            cached_usable = bool(cached_path) and os.path.exists(cached_path)
+
+            if not refresh and cached_usable:
+                # An unknown Chrome version is treated as unchanged so offline hosts keep working
+                if chrome_version is None or major_version(chrome_version) == major_version(manifest.get("chrome_version")):
+                    self._resolved_path = cached_path
+                    return cached_path
+
+            try:
+                driver_path = self._download()
+            except Exception as e:
+                if cached_usable:
+                    print(f"Could not refresh chromedriver ({e}); using cached {cached_path}")
+                    self._resolved_path = cached_path
+                    return cached_path
+                raise
+
+            self.save_manifest({
+                "chrome_version": chrome_version,
+                "driver_path": driver_path,
+                "resolved_at": time.strftime("%Y-%m-%d %H:%M:%S")
+            })
+            self._resolved_path = driver_path
+            return driver_path
+
+    def refresh(self):
+        """Force a new resolution, e.g. after a Chrome update"""
+        return self.resolve(refresh=True)
+
+    def _download(self):
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+
+
+# Shared resolver used by the driver pool
+chromedriver_resolver = ChromeDriverResolver()
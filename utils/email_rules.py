@@ -0,0 +1,80 @@
+# utils/email_rules.py
+"""
+Compiled deny rules for email candidates, loaded from a rules file
+"""
+
+import re
+
+from config.app_config import app_config
+
+RULE_KINDS = ('contains', 'local', 'domain', 'extension')
+
+# Used when the rules file is missing
+DEFAULT_RULES = [
+    ('contains', value) for value in (
+        'example@', '@example', 'test@', '@test', 'admin@admin', 'user@user', 'email@email',
+        'contact@contact', 'noreply@', 'no-reply@', 'donotreply@', 'info@info', 'support@support'
+    )
+]
+
+
+def read_rules(path):
+    """Yield (kind, value) pairs from a rules file, skipping comments and unknown kinds"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            kind, _, value = line.partition(' ')
+            value = value.strip().lower()
+            if kind not in RULE_KINDS or not value:
+                print(f"Ignoring email rule on line {line_number} of {path}: {line}")
+                continue
+            yield kind, value
+
+
+class EmailRules:
+    """Substring rules compiled into one regex alternation; local parts, domains and extensions in sets"""
+
+    def __init__(self, path=None):
+        self.path = path or app_config.EMAIL_RULES_FILE
+        self.load()
+
+    def load(self):
+        """(Re)load the rules file"""
+        try:
+            rules = list(read_rules(self.path))
+        except OSError as e:
+            print(f"Email rules not loaded, using defaults: {e}")
+            rules = DEFAULT_RULES
+
+        self.rule_count = len(rules)
+        values = {kind: set() for kind in RULE_KINDS}
+        for kind, value in rules:
+            values[kind].add(value)
+        # Longest first so the alternation prefers specific rules; one search per address
+        substrings = sorted(values['contains'], key=len, reverse=True)
+        self.contains = re.compile('|'.join(map(re.escape, substrings))) if substrings else None
+        self.locals = frozenset(values['local'])
+        self.domains = frozenset(values['domain'])
+        self.extensions = frozenset(values['extension'])
+
+    def blocks(self, email):
+        """True if a lowercased address matches any rule"""
+        if self.contains is not None and self.contains.search(email):
+            return True
+        local, _, domain = email.rpartition('@')
+        if local in self.locals:
+            return True
+        labels = domain.split('.')
+        if labels[-1] in self.extensions:
+            return True
+        # Check the domain and each parent domain: one set lookup per label
+        for start in range(len(labels) - 1):
+            if '.'.join(labels[start:]) in self.domains:
+                return True
+        return False
+
+
+# Shared rules used by email extraction
+email_rules = EmailRules()
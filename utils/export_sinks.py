@@ -0,0 +1,289 @@
+# utils/export_sinks.py
+"""
+Streaming export writers that append rows as results arrive
+"""
+
+import csv
+import json
+import os
+import time
+
+from config.app_config import app_config
+
+# Excel's hard row limit per worksheet, header included
+EXCEL_MAX_ROWS = 1048576
+
+FILE_EXTENSIONS = {
+    "json": "ndjson"
+}
+
+# Repetitive columns stored dictionary-encoded in Parquet
+DICTIONARY_COLUMNS = ("category", "domain", "source_url")
+
+
+class ExportSink:
+    """Base class for append-only export files"""
+
+    format = None
+
+    def __init__(self, filepath, fieldnames=None, flush_every=None):
+        self.filepath = filepath
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.flush_every = flush_every or app_config.EXPORT_FLUSH_EVERY
+        self.rows_written = 0
+        self.closed = False
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+
+    def write(self, record):
+        """Append one record"""
+        if self.closed:
+            raise ValueError(f"Export sink {self.filepath} is closed")
+        if self.fieldnames is None:
+            self.fieldnames = list(record.keys())
+            self.start()
+        self.write_row(record)
+        self.rows_written += 1
+        if self.rows_written % self.flush_every == 0:
+            self.flush()
+
+    def write_many(self, records):
+        """Append records from any iterable, one at a time"""
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        """Flush and close the file; safe to call more than once"""
+        if self.closed:
+            return
+        self.closed = True
+        if self.fieldnames is None:
+            self.fieldnames = []
+            self.start()
+        self.finish()
+
+    def start(self):
+        """Open the file once the columns are known"""
+
+    def write_row(self, record):
+        raise NotImplementedError
+
+    def flush(self):
+        """Push buffered rows to disk"""
+
+    def finish(self):
+        """Finalize and close the file"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class CsvSink(ExportSink):
+    """CSV writer that flushes every few rows"""
+
+    format = "csv"
+
+    def start(self):
+        self._file = open(self.filepath, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def write_row(self, record):
+        self._writer.writerow(record)
+
+    def flush(self):
+        self._file.flush()
+
+    def finish(self):
+        self._file.close()
+
+
+class XlsxSink(ExportSink):
+    """Constant-memory openpyxl workbook that rolls to a new sheet at Excel's row limit"""
+
+    format = "xlsx"
+
+    def start(self):
+        from openpyxl import Workbook
+        self._workbook = Workbook(write_only=True)
+        self._sheet_count = 0
+        self._add_sheet()
+
+    def _add_sheet(self):
+        self._sheet_count += 1
+        title = "Results" if self._sheet_count == 1 else f"Results {self._sheet_count}"
+        self._sheet = self._workbook.create_sheet(title)
+        self._sheet.append(self.fieldnames)
+        self._sheet_rows = 1
+
+    def write_row(self, record):
+        if self._sheet_rows >= EXCEL_MAX_ROWS:
+            self._add_sheet()
+        self._sheet.append([record.get(field, '') for field in self.fieldnames])
+        self._sheet_rows += 1
+
+    def finish(self):
+        self._workbook.save(self.filepath)
+
+
+class NdjsonSink(ExportSink):
+    """Newline-delimited JSON, one record per line"""
+
+    format = "json"
+
+    def start(self):
+        self._file = open(self.filepath, 'w', encoding='utf-8')
+
+    def write_row(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+        self._file.write("\n")
+
+    def flush(self):
+        self._file.flush()
+
+    def finish(self):
+        self._file.close()
+
+
+class ColumnarSink(ExportSink):
+    """Base for pyarrow writers that buffer rows into row groups"""
+
+    def __init__(self, filepath, fieldnames=None, flush_every=None, row_group_size=None):
+        super().__init__(filepath, fieldnames, flush_every)
+        self.row_group_size = row_group_size or app_config.EXPORT_ROW_GROUP_SIZE
+
+    def start(self):
+        try:
+            import pyarrow
+        except ImportError:
+            raise RuntimeError(f"{self.format} export requires pyarrow (pip install pyarrow)")
+        self._pa = pyarrow
+        self._schema = pyarrow.schema([(field, pyarrow.string()) for field in self.fieldnames])
+        self._columns = {field: [] for field in self.fieldnames}
+        self._buffered = 0
+        self._writer = self.open_writer()
+
+    def open_writer(self):
+        raise NotImplementedError
+
+    def write_row(self, record):
+        for field in self.fieldnames:
+            value = record.get(field)
+            self._columns[field].append(None if value is None else str(value))
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self.write_row_group()
+
+    def write_row_group(self):
+        if not self._buffered:
+            return
+        batch = self._pa.record_batch([self._pa.array(self._columns[field], type=self._pa.string())
+                                       for field in self.fieldnames], schema=self._schema)
+        self.write_batch(batch)
+        self._columns = {field: [] for field in self.fieldnames}
+        self._buffered = 0
+
+    def write_batch(self, batch):
+        raise NotImplementedError
+
+    def flush(self):
+        # Row groups are written when full; partial groups stay buffered until close
+        pass
+
+    def finish(self):
+        self.write_row_group()
+        self._writer.close()
+
+
+class ParquetSink(ColumnarSink):
+    """Parquet file written one row group at a time"""
+
+    format = "parquet"
+
+    def open_writer(self):
+        import pyarrow.parquet as pq
+        dictionary_columns = [field for field in self.fieldnames if field in DICTIONARY_COLUMNS]
+        return pq.ParquetWriter(self.filepath, self._schema, use_dictionary=dictionary_columns,
+                                compression="snappy")
+
+    def write_batch(self, batch):
+        self._writer.write_table(self._pa.Table.from_batches([batch]), row_group_size=self.row_group_size)
+
+
+class ArrowIpcSink(ColumnarSink):
+    """Arrow IPC (Feather v2) file written one record batch at a time"""
+
+    format = "arrow"
+
+    def open_writer(self):
+        import pyarrow.ipc as ipc
+        try:
+            options = ipc.IpcWriteOptions(compression="zstd")
+        except Exception:
+            options = None
+        return ipc.new_file(self.filepath, self._schema, options=options)
+
+    def write_batch(self, batch):
+        self._writer.write_batch(batch)
+
+
+SINK_TYPES = {
+    "csv": CsvSink,
+    "xlsx": XlsxSink,
+    "json": NdjsonSink,
+    "parquet": ParquetSink,
+    "arrow": ArrowIpcSink
+}
+
+
+def default_export_path(prefix, fmt):
+    """Timestamped path under RESULTS_DIR for a new export"""
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    extension = FILE_EXTENSIONS.get(fmt, fmt)
+    return os.path.join(app_config.RESULTS_DIR, f"{prefix}_{timestamp}.{extension}")
+
+
+def open_sink(fmt=None, filename=None, prefix="results", fieldnames=None):
+    """Open a streaming sink for one of AppConfig.EXPORT_FORMATS"""
+    fmt = (fmt or app_config.DEFAULT_EXPORT_FORMAT).lower()
+    if fmt not in app_config.EXPORT_FORMATS or fmt not in SINK_TYPES:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    if filename:
+        filepath = filename if os.path.dirname(filename) else os.path.join(app_config.RESULTS_DIR, filename)
+    else:
+        filepath = default_export_path(prefix, fmt)
+
+    return SINK_TYPES[fmt](filepath, fieldnames=fieldnames)
+
+
+def export_records(records, fmt=None, filename=None, prefix="results"):
+    """Stream records into a new export file and return its path (None if empty)"""
+    sink = open_sink(fmt, filename, prefix)
+    try:
+        sink.write_many(records)
+    finally:
+        sink.close()
+
+    if not sink.rows_written:
+        try:
+            os.remove(sink.filepath)
+        except OSError:
+            pass
+        return None
+    return sink.filepath
+
+
+def stream_to_sink(records, sink=None):
+    """Pass records through, appending each to sink; the sink is closed when the stream ends or stops"""
+    try:
+        for record in records:
+            if sink is not None:
+                sink.write(record)
+            yield record
+    finally:
+        if sink is not None:
+            sink.close()
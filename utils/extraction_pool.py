@@ -0,0 +1,140 @@
+# utils/extraction_pool.py
+"""
+Process pool that runs contact extractors on page bytes passed through shared memory
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+from config.app_config import app_config
+
+
+def extract_shared(name, size, extractor):
+    """Worker entry point: decode the page straight from shared memory and run extractor"""
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        view = segment.buf[:size]
+        try:
+            text = str(view, 'utf-8', 'replace')
+        finally:
+            view.release()
+    finally:
+        segment.close()
+    return extractor(text)
+
+
+class SharedPage:
+    """A page body copied once into a shared memory segment"""
+
+    def __init__(self, text):
+        data = (text or '').encode('utf-8')
+        self.size = len(data)
+        self.segment = shared_memory.SharedMemory(create=True, size=max(self.size, 1))
+        self.segment.buf[:self.size] = data
+
+    @property
+    def name(self):
+        return self.segment.name
+
+    def release(self):
+        self.segment.close()
+        try:
+            self.segment.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ExtractionPool:
+    """Run CPU-bound extractors off the scraping thread, one worker process per spare core"""
+
+    def __init__(self, workers=None, min_bytes=None):
+        cores = os.cpu_count() or 1
+        self.workers = workers if workers is not None else app_config.EXTRACTION_WORKERS or max(1, cores - 1)
+        self.min_bytes = app_config.EXTRACTION_POOL_MIN_BYTES if min_bytes is None else min_bytes
+        self._executor = None
+        self._broken = False
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.workers > 1 and not self._broken
+
+    def executor(self):
+        """Start the worker processes on first use"""
+        with self._lock:
+            if self._executor is None:
+                # spawn avoids forking a process that already runs browser and event loop threads
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+    def submit(self, text, extractor):
+        """Start extracting text; returns (future, shared page) or (None, None) to run inline"""
+        if not self.enabled or len(text or '') < self.min_bytes:
+            return None, None
+        page = SharedPage(text)
+        try:
+            return self.executor().submit(extract_shared, page.name, page.size, extractor), page
+        except Exception as e:
+            page.release()
+            self.disable(e)
+            return None, None
+
+    def result(self, future, page, text, extractor):
+        """Wait for a submitted extraction, falling back to inline extraction on failure"""
+        if future is None:
+            return extractor(text)
+        try:
+            return future.result()
+        except BrokenProcessPool as e:
+            self.disable(e)
+            return extractor(text)
+        except Exception as e:
+            print(f"Extraction worker error: {e}")
+            return extractor(text)
+        finally:
+            page.release()
+
+    def stream(self, pages, extractor, max_in_flight=None):
+        """Yield (page, extractor(page.html)) in input order, extracting up to max_in_flight pages at once"""
+        max_in_flight = max_in_flight or self.workers * 2
+        in_flight = deque()
+        try:
+            for page in pages:
+                future, shared = self.submit(page.html, extractor)
+                in_flight.append((page, future, shared))
+                while in_flight and (len(in_flight) >= max_in_flight or in_flight[0][1] is None
+                                     or in_flight[0][1].done()):
+                    done_page, done_future, done_shared = in_flight.popleft()
+                    yield done_page, self.result(done_future, done_shared, done_page.html, extractor)
+            while in_flight:
+                done_page, done_future, done_shared = in_flight.popleft()
+                yield done_page, self.result(done_future, done_shared, done_page.html, extractor)
+        finally:
+            for _, future, shared in in_flight:
+                if future is not None:
+                    future.cancel()
+                    shared.release()
+
+    def disable(self, error):
+        """Stop using the pool after a failure; extraction continues inline"""
+        print(f"Extraction pool disabled, extracting inline: {error}")
+        self._broken = True
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# Shared pool used by the contact scrapers
+extraction_pool = ExtractionPool()
+atexit.register(extraction_pool.shutdown)
@@ -0,0 +1,200 @@
+# utils/fetch_engine.py
+"""
+Asynchronous HTTP fetch engine with global and per-host concurrency limits
+and per-domain pacing
+"""
+
+import asyncio
+import queue
+import threading
+import time
+
+from config.app_config import app_config
+from utils.http_client import create_async_client
+from utils.page_cache import page_cache
+from utils.politeness import politeness
+from utils.url_tools import host_of
+
+DEFAULT_HEADERS = {
+    'User-Agent': app_config.USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+_DONE = object()
+
+
+class FetchResult:
+    """Outcome of fetching a single URL"""
+
+    def __init__(self, url, status=None, text='', headers=None, error=None, elapsed=0.0, final_url=None):
+        self.url = url
+        self.status = status
+        self.text = text
+        self.headers = headers or {}
+        self.error = error
+        self.elapsed = elapsed
+        self.final_url = final_url or url
+
+    @property
+    def ok(self):
+        return self.error is None and self.status == 200
+
+    @property
+    def content_type(self):
+        return self.headers.get('content-type', '').lower()
+
+
+class AsyncFetchEngine:
+    """Fetch many pages concurrently over a shared keep-alive client"""
+
+    def __init__(self, max_concurrency=None, per_host_limit=None, timeout=None, headers=None, cache=None,
+                 scheduler=None):
+        self.max_concurrency = max_concurrency or app_config.FETCH_CONCURRENCY
+        self.per_host_limit = per_host_limit or app_config.FETCH_PER_HOST_LIMIT
+        self.timeout = timeout or app_config.DEFAULT_LIMITS["timeout"]
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        if cache is None and app_config.PAGE_CACHE_ENABLED:
+            cache = page_cache
+        self.cache = cache or None
+        self.scheduler = scheduler or politeness
+
+    def create_client(self):
+        """Create the pooled async client used for one run"""
+        return create_async_client(self.headers, self.timeout, self.max_concurrency)
+
+    def fresh_from_cache(self, url):
+        """Return a FetchResult for a fresh cache entry, or None"""
+        if not self.cache:
+            return None
+        entry = self.cache.lookup(url)
+        if not entry or not entry.is_fresh(self.cache.ttl):
+            return None
+        body = self.cache.read_body(entry)
+        if body is None:
+            return None
+        self.cache.count('hits')
+        return self.cached_result(url, entry, body)
+    
+    async def fetch_one(self, client, url, host_limits):
+        """Fetch one URL under the per-host limit, revalidating any stale cache entry"""
+        entry = self.cache.lookup(url) if self.cache else None
+        
+        host_limit = host_limits.setdefault(host_of(url), asyncio.Semaphore(self.per_host_limit))
+        async with host_limit:
+            started = time.monotonic()
+            try:
+                response = await client.get(url, headers=entry.conditional_headers() if entry else None)
+                if response.status_code == 304 and entry:
+                    body = self.cache.read_body(entry)
+                    if body is not None:
+                        self.cache.touch(entry, response.headers)
+                        self.cache.count('revalidated')
+                        return self.cached_result(url, entry, body, time.monotonic() - started)
+                    response = await client.get(url)
+                
+                result = FetchResult(
+                    url,
+                    status=response.status_code,
+                    text=response.text,
+                    headers=dict(response.headers),
+                    elapsed=time.monotonic() - started,
+                    final_url=str(response.url)
+                )
+            except Exception as e:
+                return FetchResult(url, error=str(e) or type(e).__name__, elapsed=time.monotonic() - started)
+        
+        if self.cache:
+            self.cache.count('changed' if entry else 'misses')
+            self.cache.store(url, result.status, result.headers, result.text, result.final_url)
+        return result
+    
+    @staticmethod
+    def cached_result(url, entry, body, elapsed=0.0):
+        """Build a FetchResult from a cache entry"""
+        return FetchResult(url, status=entry.status, text=body, headers={'content-type': entry.content_type},
+                           elapsed=elapsed, final_url=entry.final_url)
+
+    async def iter_fetch(self, urls, stop_callback=None, skip_callback=None):
+        """Yield FetchResults as soon as each URL completes; skip_callback(url) drops URLs at dispatch"""
+        host_limits = {}
+        waiting = self.scheduler.queue([])
+        
+        # Fresh cache hits cost no request, so they skip the scheduler entirely
+        for url in urls:
+            if stop_callback and stop_callback():
+                return
+            if skip_callback and skip_callback(url):
+                continue
+            cached = self.fresh_from_cache(url)
+            if cached:
+                yield cached
+            else:
+                waiting.add(url)
+
+        async with self.create_client() as client:
+            pending = set()
+            try:
+                while waiting or pending:
+                    if stop_callback and stop_callback():
+                        break
+                    
+                    # Start every URL whose domain is ready, rotating across domains
+                    while len(pending) < self.max_concurrency:
+                        url = waiting.pop_ready(skip_callback)
+                        if url is None:
+                            break
+                        pending.add(asyncio.ensure_future(self.fetch_one(client, url, host_limits)))
+                    
+                    timeout = 0.2
+                    if waiting and len(pending) < self.max_concurrency:
+                        timeout = min(timeout, max(waiting.ready_in(), 0.01))
+                    if not pending:
+                        await asyncio.sleep(timeout)
+                        continue
+                    
+                    done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+
+    def stream(self, urls, stop_callback=None, skip_callback=None):
+        """Synchronous generator over iter_fetch, driven from a background event loop"""
+        results = queue.Queue()
+        cancelled = threading.Event()
+
+        def should_stop():
+            return cancelled.is_set() or bool(stop_callback and stop_callback())
+
+        async def pump():
+            async for result in self.iter_fetch(urls, should_stop, skip_callback):
+                results.put(result)
+
+        def run():
+            try:
+                asyncio.run(pump())
+            except Exception as e:
+                print(f"Fetch engine error: {e}")
+            finally:
+                results.put(_DONE)
+
+        worker = threading.Thread(target=run, name="fetch-engine", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            cancelled.set()
+
+    def fetch(self, url):
+        """Fetch a single URL synchronously"""
+        for result in self.stream([url]):
+            return result
+        return FetchResult(url, error="cancelled")
@@ -0,0 +1,223 @@
+# utils/http_client.py
+"""
+Shared HTTP client layer: pooled keep-alive connections, compression,
+in-process DNS caching and HTTP/2 when the h2 package is installed
+"""
+
+import atexit
+import importlib.util
+import ipaddress
+import socket
+import threading
+import time
+import urllib.request
+
+import anyio
+import httpcore
+import httpx
+
+from config.app_config import app_config
+
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+BROTLI_AVAILABLE = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+
+
+def accept_encoding():
+    """Encodings httpx can decode in this environment"""
+    return "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+
+class DnsCache:
+    """Memoize getaddrinfo results so each host is resolved once per TTL.
+
+    Only the transports built by this module consult it; socket.getaddrinfo
+    itself is left alone for Selenium and every other library.
+    """
+
+    def __init__(self, ttl=None):
+        self.ttl = app_config.DNS_CACHE_TTL if ttl is None else ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def cached(self, host, port):
+        """Return the cached addresses for host, or None"""
+        with self._lock:
+            entry = self._entries.get((host, port))
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+        return None
+
+    def resolve(self, host, port):
+        """Return every IP address of host in getaddrinfo order, resolving it on a cache miss"""
+        if is_ip_address(host):
+            return [host]
+        addresses = self.cached(host, port)
+        if addresses is not None:
+            return addresses
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self.misses += 1
+            self._entries[(host, port)] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Failures that move on to the host's next address
+CONNECT_ERRORS = (httpcore.ConnectError, httpcore.ConnectTimeout)
+
+
+def is_ip_address(host):
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+class CachedDnsBackend(httpcore.NetworkBackend):
+    """Sync httpcore backend that connects to cached addresses; TLS still verifies the hostname"""
+
+    def __init__(self, backend, cache):
+        self.backend = backend
+        self.cache = cache
+
+    def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        # Try each address in turn, like socket.create_connection does
+        error = None
+        for address in self.cache.resolve(host, port):
+            try:
+                return self.backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except CONNECT_ERRORS as e:
+                error = e
+        raise error
+
+    def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return self.backend.connect_unix_socket(path, timeout, socket_options)
+
+    def sleep(self, seconds):
+        self.backend.sleep(seconds)
+
+
+class AsyncCachedDnsBackend(httpcore.AsyncNetworkBackend):
+    """Async httpcore backend that resolves cache misses in a worker thread"""
+
+    def __init__(self, backend, cache):
+        self.backend = backend
+        self.cache = cache
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        addresses = self.cache.cached(host, port)
+        if addresses is None:
+            addresses = await anyio.to_thread.run_sync(self.cache.resolve, host, port)
+        error = None
+        for address in addresses:
+            try:
+                return await self.backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except CONNECT_ERRORS as e:
+                error = e
+        raise error
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self.backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds):
+        await self.backend.sleep(seconds)
+
+
+dns_cache = DnsCache()
+
+
+def create_transport(limits, http2, use_async=False):
+    """httpx transport whose connection pool resolves hosts through dns_cache, or None if it cannot be built"""
+    if use_async:
+        transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        backend_type = AsyncCachedDnsBackend
+    else:
+        transport = httpx.HTTPTransport(limits=limits, http2=http2)
+        backend_type = CachedDnsBackend
+    # httpx has no public hook for the network backend of its pool; requirements.txt pins the
+    # versions these attributes exist in, and anything else falls back to httpx's own transport
+    pool = getattr(transport, '_pool', None)
+    if not isinstance(getattr(pool, '_network_backend', None), (httpcore.NetworkBackend, httpcore.AsyncNetworkBackend)):
+        print(f"DNS cache disabled: unsupported httpx {httpx.__version__} / httpcore {httpcore.__version__}")
+        return None
+    pool._network_backend = backend_type(pool._network_backend, dns_cache)
+    return transport
+
+
+def env_proxy_configured():
+    """True if the environment routes http or https traffic through a proxy"""
+    proxies = urllib.request.getproxies()
+    return any(proxies.get(scheme) for scheme in ('http', 'https', 'all'))
+
+
+def client_options(headers=None, timeout=None, max_connections=None, use_async=False):
+    """Keyword arguments shared by the sync and async clients"""
+    max_connections = max_connections or app_config.HTTP_MAX_CONNECTIONS
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=app_config.HTTP_KEEPALIVE_EXPIRY
+    )
+    http2 = H2_AVAILABLE and app_config.HTTP2_ENABLED
+    options = {
+        'headers': dict({'Accept-Encoding': accept_encoding()}, **(headers or {})),
+        'timeout': httpx.Timeout(timeout or app_config.DEFAULT_TIMEOUT),
+        'limits': limits,
+        'http2': http2,
+        'follow_redirects': True
+    }
+    # An explicit transport makes httpx ignore HTTP(S)_PROXY, so proxied setups keep the default one
+    if app_config.DNS_CACHE_ENABLED and not env_proxy_configured():
+        transport = create_transport(limits, http2, use_async)
+        if transport is not None:
+            options['transport'] = transport
+    return options
+
+
+def create_async_client(headers=None, timeout=None, max_connections=None):
+    """Create a pooled httpx.AsyncClient; one per event loop"""
+    return httpx.AsyncClient(**client_options(headers, timeout, max_connections, use_async=True))
+
+
+class SharedHttpClient:
+    """Process-wide httpx.Client created on first use"""
+
+    def __init__(self):
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(**client_options())
+            return self._client
+
+    def request(self, method, url, **kwargs):
+        return self.client.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.client.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.client.post(url, **kwargs)
+
+    def close(self):
+        """Close pooled connections"""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+# Shared client for web API calls and one-off requests
+http_client = SharedHttpClient()
+atexit.register(http_client.close)
@@ -0,0 +1,230 @@
+# utils/page_cache.py
+"""
+On-disk cache of fetched pages with TTL, conditional revalidation and LRU eviction
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from config.app_config import app_config
+from utils.url_tools import canonicalize_url
+
+# Cached bodies are only kept for page-like content
+CACHEABLE_TYPES = ('text/', 'html', 'xml', 'json')
+# Evict down to this share of the byte budget so eviction does not run on every store
+EVICT_TARGET = 0.9
+
+
+class CachedPage:
+    """A cache index entry; the body is loaded separately"""
+
+    def __init__(self, key, url, status, content_type, etag, last_modified, fetched_at, size, final_url=None):
+        self.key = key
+        self.url = url
+        self.status = status
+        self.content_type = content_type or ''
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        self.size = size
+        self.final_url = final_url or url
+
+    def is_fresh(self, ttl):
+        return time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self):
+        """Request headers that let the server answer 304 Not Modified"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """Compressed page bodies keyed by canonical URL, indexed in SQLite"""
+
+    def __init__(self, directory=None, ttl=None, max_bytes=None):
+        self.directory = directory or os.path.join(app_config.DATA_DIR, "page_cache")
+        self.ttl = app_config.PAGE_CACHE_TTL if ttl is None else ttl
+        self.max_bytes = app_config.PAGE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self._lock = threading.RLock()
+        self._conn = None
+        self._total_bytes = 0
+        self.counters = {'hits': 0, 'misses': 0, 'revalidated': 0, 'changed': 0, 'stored': 0, 'evicted': 0}
+
+    def connect(self):
+        """Open the index on first use"""
+        if self._conn is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._conn = sqlite3.connect(os.path.join(self.directory, "index.db"), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    final_url TEXT,
+                    status INTEGER,
+                    content_type TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at)")
+            self._conn.commit()
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        return self._conn
+
+    @staticmethod
+    def key_for(url):
+        """Cache key of a URL: hash of its canonical form"""
+        return hashlib.sha256(canonicalize_url(url).encode('utf-8')).hexdigest()
+
+    def body_path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.z")
+
+    def lookup(self, url):
+        """Return the CachedPage for url, or None"""
+        key = self.key_for(url)
+        with self._lock:
+            row = self.connect().execute("""
+                SELECT key, url, status, content_type, etag, last_modified, fetched_at, size, final_url
+                FROM pages WHERE key = ?
+            """, (key,)).fetchone()
+        return CachedPage(*row) if row else None
+
+    def read_body(self, entry):
+        """Load and decompress a cached body, or None if the file is gone"""
+        try:
+            with open(self.body_path(entry.key), 'rb') as f:
+                body = zlib.decompress(f.read()).decode('utf-8')
+        except (OSError, zlib.error, UnicodeDecodeError):
+            self.remove(entry.key)
+            return None
+        with self._lock:
+            self.connect().execute("UPDATE pages SET accessed_at = ? WHERE key = ?", (time.time(), entry.key))
+            self._conn.commit()
+        return body
+
+    def is_cacheable(self, status, headers):
+        """Only successful page-like responses without no-store are kept"""
+        if status != 200:
+            return False
+        cache_control = headers.get('cache-control', '').lower()
+        if 'no-store' in cache_control:
+            return False
+        content_type = headers.get('content-type', '').lower()
+        return not content_type or any(kind in content_type for kind in CACHEABLE_TYPES)
+
+    def store(self, url, status, headers, text, final_url=None):
+        """Compress and cache a response body, evicting old entries past the byte budget"""
+        if not self.is_cacheable(status, headers):
+            return
+        key = self.key_for(url)
+        data = zlib.compress((text or '').encode('utf-8'), 6)
+        path = self.body_path(key)
+        now = time.time()
+        with self._lock:
+            conn = self.connect()
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(data)
+            except OSError as e:
+                print(f"Error writing page cache entry: {e}")
+                return
+            previous = conn.execute("SELECT size FROM pages WHERE key = ?", (key,)).fetchone()
+            conn.execute("""
+                INSERT OR REPLACE INTO pages
+                (key, url, final_url, status, content_type, etag, last_modified, fetched_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, url, final_url or url, status, headers.get('content-type', ''), headers.get('etag'),
+                  headers.get('last-modified'), now, now, len(data)))
+            conn.commit()
+            self._total_bytes += len(data) - (previous[0] if previous else 0)
+            self.counters['stored'] += 1
+            if self._total_bytes > self.max_bytes:
+                self.evict(int(self.max_bytes * EVICT_TARGET))
+
+    def touch(self, entry, headers):
+        """Mark a revalidated entry fresh again, taking any updated validators"""
+        with self._lock:
+            self.connect().execute("""
+                UPDATE pages SET fetched_at = ?, accessed_at = ?,
+                    etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)
+                WHERE key = ?
+            """, (time.time(), time.time(), headers.get('etag'), headers.get('last-modified'), entry.key))
+            self._conn.commit()
+
+    def remove(self, key):
+        """Drop one entry and its body file"""
+        with self._lock:
+            conn = self.connect()
+            row = conn.execute("SELECT size FROM pages WHERE key = ?", (key,)).fetchone()
+            conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+            conn.commit()
+            if row:
+                self._total_bytes -= row[0]
+        try:
+            os.remove(self.body_path(key))
+        except OSError:
+            pass
+
+    def evict(self, target_bytes):
+        """Remove least recently used entries until the cache fits in target_bytes"""
+        with self._lock:
+            conn = self.connect()
+            victims = []
+            total = self._total_bytes
+            for key, size in conn.execute("SELECT key, size FROM pages ORDER BY accessed_at"):
+                if total <= target_bytes:
+                    break
+                victims.append(key)
+                total -= size
+            conn.executemany("DELETE FROM pages WHERE key = ?", [(key,) for key in victims])
+            conn.commit()
+            self._total_bytes = total
+            self.counters['evicted'] += len(victims)
+        for key in victims:
+            try:
+                os.remove(self.body_path(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove every cached page"""
+        self.evict(0)
+
+    def count(self, event):
+        """Count a lookup outcome: hits, misses, revalidated or changed"""
+        with self._lock:
+            self.counters[event] += 1
+
+    def stats(self):
+        """Return hit/miss/revalidation counts and the cache size"""
+        with self._lock:
+            self.connect()
+            stats = dict(self.counters)
+            stats['entries'] = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            stats['bytes'] = self._total_bytes
+        lookups = stats['hits'] + stats['misses'] + stats['revalidated'] + stats['changed']
+        stats['hit_rate'] = round((stats['hits'] + stats['revalidated']) / lookups, 3) if lookups else 0.0
+        return stats
+
+    def describe(self):
+        """One-line summary for progress output"""
+        stats = self.stats()
+        return (f"🗄️ Page cache: {stats['hits']} hits, {stats['revalidated']} revalidated, "
+                f"{stats['changed']} changed, {stats['misses']} misses "
+                f"({stats['entries']} pages, {stats['bytes'] / (1024 * 1024):.1f} MB)")
+
+
+# Shared cache used by the HTTP fetch engine
+page_cache = PageCache()
@@ -0,0 +1,88 @@
+# utils/page_text.py
+"""
+Reduce a page to the text a visitor can see before running contact regexes
+"""
+
+from collections import namedtuple
+from urllib.parse import unquote
+
+from lxml import etree, html as lxml_html
+
+# Elements whose content is never visible contact text
+DROPPED_TAGS = ('script', 'style', 'svg', 'noscript', 'template', 'iframe', 'object', 'canvas', 'math')
+# Elements that separate words, so text on both sides must not be glued together
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figcaption',
+    'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav',
+    'ol', 'option', 'p', 'pre', 'section', 'table', 'td', 'th', 'title', 'tr', 'ul', 'button', 'label'
+}
+# Attributes whose values people read; others hold styling, IDs or URLs full of numeric tokens
+TEXT_ATTRIBUTES = {'alt', 'title', 'content', 'value', 'placeholder', 'aria-label', 'label',
+                   'data-email', 'data-phone', 'data-tel'}
+SKIPPED_VALUE_PREFIXES = ('data:', 'javascript:')
+
+PageText = namedtuple('PageText', ['text', 'emails', 'phones'])
+
+
+def mailto_addresses(href):
+    """Addresses of a mailto: link, without the query part"""
+    addresses = unquote(href[7:].split('?', 1)[0])
+    return [address.strip() for address in addresses.split(',') if address.strip()]
+
+
+def visible_text(page_source):
+    """Return PageText(text, emails, phones) for a page.
+
+    text holds visible text, readable attribute values and JSON-LD; emails and phones
+    come straight from mailto: and tel: links. Unparseable input is returned
+    unchanged as text.
+    """
+    if not page_source or not page_source.strip():
+        return PageText('', [], [])
+    try:
+        root = lxml_html.fromstring(page_source)
+    except (etree.ParserError, ValueError) as e:
+        print(f"Could not parse page, scanning raw source: {e}")
+        return PageText(page_source, [], [])
+
+    # JSON-LD blocks often carry the business email and telephone; keep them before scripts are dropped
+    structured = [script.text for script in root.iter('script')
+                  if 'ld+json' in (script.get('type') or '').lower() and script.text]
+    etree.strip_elements(root, *DROPPED_TAGS, with_tail=False)
+    parts = []
+    emails = []
+    phones = []
+    for event, element in etree.iterwalk(root, events=('start', 'end')):
+        tag = element.tag
+        if not isinstance(tag, str):
+            # Comments and processing instructions only contribute their tail
+            if event == 'end' and element.tail:
+                parts.append(element.tail)
+            continue
+        tag = tag.lower()
+
+        if event == 'start':
+            if tag in BLOCK_TAGS:
+                parts.append('\n')
+            for name, value in element.attrib.items():
+                name = name.lower()
+                value = value.strip()
+                if not value:
+                    continue
+                lowered = value[:11].lower()
+                if name == 'href' and lowered.startswith('mailto:'):
+                    emails.extend(mailto_addresses(value))
+                elif name == 'href' and lowered.startswith('tel:'):
+                    phones.append(unquote(value[4:]).strip())
+                elif name in TEXT_ATTRIBUTES and not lowered.startswith(SKIPPED_VALUE_PREFIXES):
+                    parts.append(f"\n{value}\n")
+            if element.text:
+                parts.append(element.text)
+        else:
+            if tag in BLOCK_TAGS:
+                parts.append('\n')
+            if element.tail:
+                parts.append(element.tail)
+
+    parts.extend(f"\n{data}\n" for data in structured)
+    return PageText(''.join(parts), emails, phones)
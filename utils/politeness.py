@@ -0,0 +1,139 @@
+# utils/politeness.py
+"""
+Per-domain request pacing that interleaves hosts instead of sleeping globally
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+
+from config.app_config import app_config
+from utils.url_tools import domain_of
+
+
+class TokenBucket:
+    """Token bucket refilled at one token per delay seconds"""
+
+    def __init__(self, delay, capacity=1):
+        self.delay = delay
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        if self.delay <= 0:
+            self.tokens = float(self.capacity)
+        else:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.delay)
+        self.updated = now
+
+    def try_take(self, now):
+        """Take a token if one is available"""
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def wait_time(self, now):
+        """Seconds until a token is available"""
+        self.refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) * self.delay
+
+
+class PolitenessScheduler:
+    """Keep a token bucket per registered domain shared by every fetch path"""
+
+    def __init__(self, delay=None, burst=None):
+        self.delay = app_config.DEFAULT_LIMITS["delay_between_requests"] if delay is None else delay
+        self.burst = burst or app_config.POLITENESS_BURST
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, domain):
+        """Return the bucket for a domain, creating it at the default rate"""
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = TokenBucket(self.delay, self.burst)
+        return bucket
+
+    def set_delay(self, domain, delay):
+        """Slow a domain down, e.g. to its robots.txt Crawl-delay; never faster than the default"""
+        with self._lock:
+            self.bucket(domain).delay = max(self.delay, delay)
+
+    def try_acquire(self, url):
+        """Take a request slot for url's domain without waiting"""
+        with self._lock:
+            return self.bucket(domain_of(url)).try_take(time.monotonic())
+
+    def wait_time(self, url):
+        """Seconds until url's domain may be requested again"""
+        with self._lock:
+            return self.bucket(domain_of(url)).wait_time(time.monotonic())
+
+    def acquire(self, url, stop_callback=None):
+        """Block until url's domain may be requested; returns False if stopped while waiting"""
+        while not self.try_acquire(url):
+            if stop_callback and stop_callback():
+                return False
+            time.sleep(min(max(self.wait_time(url), 0.01), 0.2))
+        return True
+
+    def queue(self, urls):
+        """Group urls into per-domain queues served round-robin"""
+        return HostQueues(self, urls)
+
+
+class HostQueues:
+    """Pending URLs grouped by registered domain, handed out as their domains become ready"""
+
+    def __init__(self, scheduler, urls=()):
+        self.scheduler = scheduler
+        self._queues = OrderedDict()
+        self._size = 0
+        for url in urls:
+            self.add(url)
+
+    def add(self, url):
+        """Queue a URL behind others from the same domain"""
+        self._queues.setdefault(domain_of(url), deque()).append(url)
+        self._size += 1
+
+    def pop_ready(self, skip_callback=None):
+        """Return the next URL whose domain has a token, rotating across domains, or None.
+
+        URLs for which skip_callback(url) is true are dropped without using a token.
+        """
+        for domain in list(self._queues):
+            urls = self._queues[domain]
+            while skip_callback and urls and skip_callback(urls[0]):
+                urls.popleft()
+                self._size -= 1
+            if not urls:
+                del self._queues[domain]
+                continue
+            if not self.scheduler.try_acquire(urls[0]):
+                continue
+            url = urls.popleft()
+            self._size -= 1
+            if urls:
+                # Move the domain to the back so other hosts get the next turn
+                self._queues.move_to_end(domain)
+            else:
+                del self._queues[domain]
+            return url
+        return None
+
+    def ready_in(self):
+        """Seconds until some queued domain becomes ready"""
+        if not self._queues:
+            return 0.0
+        return min(self.scheduler.wait_time(urls[0]) for urls in self._queues.values())
+
+    def __len__(self):
+        return self._size
+
+
+# Shared scheduler so concurrent scrapers pace the same domains together
+politeness = PolitenessScheduler()
@@ -0,0 +1,203 @@
+# utils/robots.py
+"""
+Cached robots.txt policies compiled into fast path matchers
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+from config.app_config import app_config
+from utils.url_tools import domain_of
+
+
+def origin_of(url):
+    """Return scheme://host[:port] of a URL, or '' if it has none"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return ''
+    if not parts.scheme or not parts.netloc:
+        return ''
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def path_of(url):
+    """Path and query of a URL, as matched by robots rules"""
+    parts = urlsplit(url)
+    return (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+
+def compile_rule(pattern):
+    """Translate a robots path pattern (* wildcard, $ anchor) into a regex"""
+    anchored = pattern.endswith('$')
+    if anchored:
+        pattern = pattern[:-1]
+    regex = '.*'.join(re.escape(part) for part in pattern.split('*'))
+    return re.compile(regex + ('$' if anchored else ''))
+
+
+def parse_robots(text, agent):
+    """Return (rules, crawl_delay) for the group that best matches agent.
+
+    rules is a list of [allow, pattern]; the most specific user-agent group
+    wins, falling back to '*'.
+    """
+    agent = agent.lower()
+    groups = {}
+    current_agents = []
+    in_rules = False
+
+    for raw_line in (text or '').splitlines():
+        line = raw_line.split('#', 1)[0].strip()
+        if ':' not in line:
+            continue
+        field, value = line.split(':', 1)
+        field = field.strip().lower()
+        value = value.strip()
+
+        if field == 'user-agent':
+            if in_rules:
+                current_agents = []
+                in_rules = False
+            current_agents.append(value.lower())
+            for name in current_agents:
+                groups.setdefault(name, {'rules': [], 'delay': None})
+        elif field in ('allow', 'disallow', 'crawl-delay'):
+            in_rules = True
+            for name in current_agents:
+                group = groups[name]
+                if field == 'crawl-delay':
+                    try:
+                        group['delay'] = float(value)
+                    except ValueError:
+                        pass
+                elif value:
+                    group['rules'].append([field == 'allow', value])
+
+    matching = [name for name in groups if name != '*' and name in agent]
+    if matching:
+        group = groups[max(matching, key=len)]
+    else:
+        group = groups.get('*', {'rules': [], 'delay': None})
+    return group['rules'], group['delay']
+
+
+class RobotsPolicy:
+    """Compiled allow/disallow rules for one origin"""
+
+    def __init__(self, rules=None, crawl_delay=None, fetched_at=None, ttl=None, disallow_all=False):
+        self.rules = rules or []
+        self.crawl_delay = crawl_delay
+        self.fetched_at = fetched_at or time.time()
+        self.ttl = ttl
+        self.disallow_all = disallow_all
+        # Longest pattern wins; on equal length Allow beats Disallow
+        ordered = sorted(self.rules, key=lambda rule: (-len(rule[1]), not rule[0]))
+        self._matchers = [(allow, compile_rule(pattern)) for allow, pattern in ordered]
+
+    def allows(self, url):
+        """Check whether url may be fetched"""
+        if self.disallow_all:
+            return False
+        path = path_of(url)
+        if path == '/robots.txt':
+            return True
+        for allow, matcher in self._matchers:
+            if matcher.match(path):
+                return allow
+        return True
+
+    def is_fresh(self):
+        return time.time() - self.fetched_at < self.ttl
+
+    def to_dict(self):
+        return {'rules': self.rules, 'delay': self.crawl_delay, 'fetched': self.fetched_at,
+                'ttl': self.ttl, 'disallow_all': self.disallow_all}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('rules'), data.get('delay'), data.get('fetched'), data.get('ttl'),
+                   data.get('disallow_all', False))
+
+
+class RobotsCache:
+    """Fetch robots.txt once per origin and keep the compiled policy under DATA_DIR"""
+
+    def __init__(self, path=None, agent=None, ttl=None):
+        self.path = path or os.path.join(app_config.DATA_DIR, "robots_cache.json")
+        self.agent = agent or app_config.ROBOTS_USER_AGENT
+        self.ttl = app_config.ROBOTS_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._policies = self.load()
+        self.disallowed = 0
+
+    def load(self):
+        """Load cached policies, dropping expired ones"""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        policies = {origin: RobotsPolicy.from_dict(entry) for origin, entry in data.items()}
+        return {origin: policy for origin, policy in policies.items() if policy.is_fresh()}
+
+    def save(self):
+        """Persist cached policies"""
+        with self._lock:
+            data = {origin: policy.to_dict() for origin, policy in self._policies.items()}
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(data, f)
+        except Exception as e:
+            print(f"Error saving robots cache: {e}")
+
+    def policy_for(self, url):
+        """Return the fresh cached policy for url's origin, or None"""
+        with self._lock:
+            policy = self._policies.get(origin_of(url))
+        return policy if policy and policy.is_fresh() else None
+
+    def policy_from_response(self, result):
+        """Build a policy from a robots.txt FetchResult (RFC 9309 status handling)"""
+        if result.status and 200 <= result.status < 300:
+            rules, delay = parse_robots(result.text, self.agent)
+            return RobotsPolicy(rules, delay, ttl=self.ttl)
+        if result.status and 400 <= result.status < 500:
+            # No robots.txt: everything is allowed
+            return RobotsPolicy(ttl=self.ttl)
+        # Server error or unreachable: treat as disallowed for a short while
+        return RobotsPolicy(ttl=app_config.ROBOTS_ERROR_TTL, disallow_all=True)
+
+    def prefetch(self, urls, fetch_engine, stop_callback=None):
+        """Fetch and compile robots.txt for every origin in urls that has no fresh policy"""
+        missing = sorted({origin_of(url) for url in urls if origin_of(url) and not self.policy_for(url)})
+        if not missing:
+            return
+        for result in fetch_engine.stream([f"{origin}/robots.txt" for origin in missing], stop_callback):
+            policy = self.policy_from_response(result)
+            with self._lock:
+                self._policies[origin_of(result.url)] = policy
+        self.save()
+
+    def filter(self, urls, fetch_engine, scheduler=None, stop_callback=None):
+        """Return the URLs robots.txt allows; Crawl-delay values are passed to the scheduler"""
+        self.prefetch(urls, fetch_engine, stop_callback)
+        allowed = []
+        for url in urls:
+            policy = self.policy_for(url)
+            if policy and not policy.allows(url):
+                self.disallowed += 1
+                continue
+            if policy and policy.crawl_delay and scheduler:
+                scheduler.set_delay(domain_of(url), min(policy.crawl_delay, app_config.ROBOTS_MAX_CRAWL_DELAY))
+            allowed.append(url)
+        return allowed
+
+
+# Shared robots.txt cache used by the contact scrapers
+robots_cache = RobotsCache()
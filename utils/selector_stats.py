@@ -0,0 +1,120 @@
+# utils/selector_stats.py
+"""
+Hit-rate statistics for CSS selector fallback lists
+"""
+
+import json
+import os
+import threading
+import time
+
+from config.app_config import app_config
+
+# Weight of older observations in the recent success score
+RECENT_DECAY = 0.8
+# Score given to selectors that have never been tried
+UNSEEN_SCORE = 0.5
+# Minimum attempts before a selector is flagged as dead in the report
+REPORT_MIN_ATTEMPTS = 10
+
+
+class SelectorRegistry:
+    """Record selector hits and misses and order candidates by recent success"""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(app_config.DATA_DIR, "selector_stats.json")
+        self._lock = threading.Lock()
+        self._stats = self.load()
+        self._dirty = False
+
+    def load(self):
+        """Load persisted statistics"""
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """Persist statistics if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.loads(json.dumps(self._stats))
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            print(f"Error saving selector stats: {e}")
+
+    def record(self, field, selector, hit):
+        """Record one lookup of selector for field"""
+        with self._lock:
+            entry = self._stats.setdefault(field, {}).setdefault(
+                selector, {'hits': 0, 'misses': 0, 'recent': UNSEEN_SCORE, 'last_hit': None})
+            if hit:
+                entry['hits'] += 1
+                entry['last_hit'] = time.strftime("%Y-%m-%d %H:%M:%S")
+            else:
+                entry['misses'] += 1
+            entry['recent'] = RECENT_DECAY * entry['recent'] + (1 - RECENT_DECAY) * (1.0 if hit else 0.0)
+            self._dirty = True
+
+    def record_attempts(self, field, candidates, matched):
+        """Record a fallback walk: every candidate before matched missed, matched hit"""
+        for selector in candidates:
+            if selector == matched:
+                self.record(field, selector, True)
+                return
+            self.record(field, selector, False)
+
+    def ordered(self, field, candidates):
+        """Return candidates sorted by recent success, keeping the given order on ties"""
+        with self._lock:
+            field_stats = self._stats.get(field, {})
+            scores = [field_stats.get(selector, {}).get('recent', UNSEEN_SCORE) for selector in candidates]
+        ranked = sorted(range(len(candidates)), key=lambda index: (-scores[index], index))
+        return [candidates[index] for index in ranked]
+
+    def ordered_table(self, table):
+        """Apply ordered() to every field of a selector table"""
+        return {field: self.ordered(field, candidates) for field, candidates in table.items()}
+
+    def report(self):
+        """Return per-field selector statistics, best first"""
+        with self._lock:
+            snapshot = json.loads(json.dumps(self._stats))
+
+        report = {}
+        for field, selectors in sorted(snapshot.items()):
+            rows = []
+            for selector, entry in selectors.items():
+                attempts = entry['hits'] + entry['misses']
+                rows.append({
+                    'selector': selector,
+                    'hits': entry['hits'],
+                    'misses': entry['misses'],
+                    'hit_rate': round(entry['hits'] / attempts, 3) if attempts else 0.0,
+                    'recent': round(entry['recent'], 3),
+                    'last_hit': entry['last_hit']
+                })
+            rows.sort(key=lambda row: -row['recent'])
+            report[field] = rows
+        return report
+
+    def format_report(self):
+        """Human readable report; fields whose best selector is failing are flagged"""
+        lines = []
+        for field, rows in self.report().items():
+            best = rows[0] if rows else None
+            shifted = best and best['hits'] + best['misses'] >= REPORT_MIN_ATTEMPTS and best['recent'] < 0.2
+            lines.append(f"{field}{'  ⚠️ markup may have changed' if shifted else ''}")
+            for row in rows:
+                lines.append(f"   {row['recent']:.2f} recent  {row['hit_rate']:.0%} of {row['hits'] + row['misses']}  {row['selector']}")
+        return "\n".join(lines) if lines else "No selector statistics recorded yet"
+
+
+# Shared registry used by the scrapers
+selector_registry = SelectorRegistry()
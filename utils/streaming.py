@@ -0,0 +1,58 @@
+# utils/streaming.py
+"""
+Bridge blocking record generators into asyncio consumers
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+_DONE = object()
+
+
+async def aiter_in_thread(make_iterator, *args, stop_callback=None, buffer_size=100, **kwargs):
+    """Run make_iterator(*args, stop_callback=..., **kwargs) on a thread and yield its items.
+
+    The producer is stopped through its stop_callback when the consumer
+    stops iterating, and blocks once buffer_size items are waiting.
+    """
+    loop = asyncio.get_running_loop()
+    items = asyncio.Queue(maxsize=buffer_size)
+    cancelled = threading.Event()
+
+    def should_stop():
+        return cancelled.is_set() or bool(stop_callback and stop_callback())
+
+    def put(item):
+        future = asyncio.run_coroutine_threadsafe(items.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=0.1)
+                return True
+            except concurrent.futures.TimeoutError:
+                if cancelled.is_set():
+                    future.cancel()
+                    return False
+
+    def produce():
+        try:
+            for item in make_iterator(*args, stop_callback=should_stop, **kwargs):
+                if not put(item):
+                    break
+        except Exception as e:
+            put(e)
+        finally:
+            put(_DONE)
+
+    producer = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item = await items.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        cancelled.set()
+        await producer
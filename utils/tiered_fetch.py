@@ -0,0 +1,202 @@
+# utils/tiered_fetch.py
+"""
+Static HTTP first, headless browser only for pages that need JavaScript
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+from config.app_config import app_config
+from utils.robots import robots_cache
+from utils.url_tools import domain_of
+
+TIER_HTTP = "http"
+TIER_BROWSER = "browser"
+
+# Statuses that usually mean a bot wall or JS challenge the browser can pass
+CHALLENGE_STATUSES = {403, 429, 503}
+
+MIN_BODY_BYTES = 512
+MIN_VISIBLE_CHARS = 200
+
+SCRIPT_STYLE_PATTERN = re.compile(r'<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>', re.I | re.S)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPA_SHELL_PATTERN = re.compile(
+    r'<div[^>]+id=["\'](root|app|__next|___gatsby|svelte|main-app)["\'][^>]*>\s*</div>', re.I)
+NOSCRIPT_JS_PATTERN = re.compile(
+    r'<noscript[^>]*>(?:(?!</noscript>).){0,300}?(enable|requires?|turn on|need)\s[^<]{0,40}javascript', re.I | re.S)
+
+
+def visible_text_length(html):
+    """Rough count of visible characters in an HTML document"""
+    text = TAG_PATTERN.sub(' ', SCRIPT_STYLE_PATTERN.sub(' ', html))
+    return len(WHITESPACE_PATTERN.sub('', text))
+
+
+def needs_browser(page):
+    """Decide whether an HTTP response is a JS-rendered shell worth rendering in Chrome"""
+    if page.error or page.status is None:
+        # DNS failures, refused connections and timeouts: the host is down, not JS-rendered
+        return False
+    if page.status in CHALLENGE_STATUSES:
+        return True
+    if page.status != 200:
+        return False
+
+    content_type = page.content_type
+    if content_type and 'html' not in content_type:
+        return False
+
+    html = page.text or ''
+    if len(html.strip()) < MIN_BODY_BYTES:
+        return True
+
+    visible = visible_text_length(html)
+    if visible < MIN_VISIBLE_CHARS // 4:
+        return True
+    if visible < MIN_VISIBLE_CHARS and (SPA_SHELL_PATTERN.search(html) or NOSCRIPT_JS_PATTERN.search(html)):
+        return True
+    return False
+
+
+class RenderedPage:
+    """Page content together with the tier that produced it"""
+
+    def __init__(self, url, html, tier, status=None):
+        self.url = url
+        self.html = html or ''
+        self.tier = tier
+        self.status = status
+
+    @property
+    def ok(self):
+        """True if the page was actually retrieved, not a transport error or an error status"""
+        if not self.html:
+            return False
+        return self.tier == TIER_BROWSER or self.status is None or self.status < 400
+
+
+class TierMemory:
+    """Remember per registered domain which tier served its pages"""
+
+    def __init__(self, path=None, ttl=None):
+        self.path = path or os.path.join(app_config.DATA_DIR, "fetch_tiers.json")
+        self.ttl = app_config.TIER_MEMORY_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._tiers = self.load()
+
+    def load(self):
+        """Load remembered tiers, dropping expired entries"""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        cutoff = time.time() - self.ttl
+        return {domain: entry for domain, entry in data.items() if entry.get('updated', 0) >= cutoff}
+
+    def save(self):
+        """Persist remembered tiers"""
+        with self._lock:
+            data = dict(self._tiers)
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(data, f)
+        except Exception as e:
+            print(f"Error saving fetch tiers: {e}")
+
+    def tier_for(self, url):
+        """Return the remembered tier for a URL's domain, or None"""
+        with self._lock:
+            entry = self._tiers.get(domain_of(url))
+        return entry['tier'] if entry else None
+
+    def record(self, url, tier):
+        """Remember the tier that worked for a URL's domain"""
+        with self._lock:
+            self._tiers[domain_of(url)] = {'tier': tier, 'updated': time.time()}
+
+
+class TieredFetcher:
+    """Serve pages over HTTP and escalate to the browser only on demand"""
+
+    def __init__(self, fetch_engine, memory=None, robots=None):
+        self.fetch_engine = fetch_engine
+        self.memory = memory or TierMemory()
+        if robots is None and app_config.ROBOTS_ENABLED:
+            robots = robots_cache
+        self.robots = robots or None
+        self.counters = {TIER_HTTP: 0, TIER_BROWSER: 0, 'escalated': 0, 'failed': 0, 'disallowed': 0}
+
+    def stream(self, urls, render, stop_callback=None, skip_callback=None):
+        """Yield RenderedPage objects; render(url) loads a page in the browser.
+
+        URLs for which skip_callback(url) turns true before they are fetched are dropped.
+        """
+        urls = list(urls)
+        if self.robots and urls:
+            # Drop disallowed URLs before spending any HTTP or browser work on them
+            allowed = self.robots.filter(urls, self.fetch_engine, self.fetch_engine.scheduler, stop_callback)
+            self.counters['disallowed'] += len(urls) - len(allowed)
+            urls = allowed
+        
+        http_urls = []
+        browser_urls = []
+        for url in urls:
+            if self.memory.tier_for(url) == TIER_BROWSER:
+                browser_urls.append(url)
+            else:
+                http_urls.append(url)
+
+        try:
+            for page in self.fetch_engine.stream(http_urls, stop_callback, skip_callback):
+                if not needs_browser(page):
+                    if not page.error:
+                        self.memory.record(page.url, TIER_HTTP)
+                    yield self._count(RenderedPage(page.url, page.text, TIER_HTTP, page.status))
+                    continue
+
+                if skip_callback and skip_callback(page.url):
+                    continue
+                self.counters['escalated'] += 1
+                if not self.fetch_engine.scheduler.acquire(page.url, stop_callback):
+                    break
+                html = render(page.url)
+                if html and visible_text_length(html) >= MIN_VISIBLE_CHARS // 4:
+                    self.memory.record(page.url, TIER_BROWSER)
+                yield self._count(RenderedPage(page.url, html, TIER_BROWSER, page.status))
+
+            for url in browser_urls:
+                if skip_callback and skip_callback(url):
+                    continue
+                if not self.fetch_engine.scheduler.acquire(url, stop_callback):
+                    break
+                yield self._count(RenderedPage(url, render(url), TIER_BROWSER))
+        finally:
+            self.memory.save()
+
+    def stats(self):
+        """Return page counts and the share served by each tier"""
+        served = self.counters[TIER_HTTP] + self.counters[TIER_BROWSER]
+        stats = dict(self.counters)
+        for tier in (TIER_HTTP, TIER_BROWSER):
+            stats[f'{tier}_share'] = round(self.counters[tier] / served, 3) if served else 0.0
+        return stats
+
+    def describe(self):
+        """One-line summary for progress output"""
+        stats = self.stats()
+        return (f"📊 Pages served: {stats['http_share']:.0%} HTTP, {stats['browser_share']:.0%} browser "
+                f"({stats['escalated']} escalated, {stats['failed']} empty, "
+                f"{stats['disallowed']} blocked by robots.txt)")
+
+    def _count(self, rendered):
+        self.counters[rendered.tier] += 1
+        if not rendered.html:
+            self.counters['failed'] += 1
+        return rendered
@@ -0,0 +1,99 @@
+# utils/url_tools.py
+"""
+URL and hostname helpers shared by the scrapers
+"""
+
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Query parameters that only track the visit and never change the page
+TRACKING_PARAMS = {
+    'gclid', 'dclid', 'gbraid', 'wbraid', 'fbclid', 'msclkid', 'yclid', 'twclid', 'igshid',
+    'mc_cid', 'mc_eid', '_ga', '_gl', '_hsenc', '_hsmi', 'mkt_tok', 'srsltid', 'ref_src'
+}
+TRACKING_PREFIXES = ('utm_', 'hsa_', 'pk_')
+
+# Second-level labels under country TLDs that act as public suffixes (co.uk, com.au, ...)
+SECOND_LEVEL_SUFFIXES = {'co', 'com', 'org', 'net', 'gov', 'edu', 'ac', 'or', 'ne', 'go', 'gob', 'nic', 'ltd', 'plc'}
+
+
+def host_of(url):
+    """Return the lowercased host of a URL"""
+    try:
+        return (urlsplit(url).hostname or '').lower()
+    except ValueError:
+        return ''
+
+
+def registered_domain(host):
+    """Approximate the registrable domain of a host (example.co.uk, example.com)"""
+    host = (host or '').lower().strip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    labels = host.split('.')
+    if len(labels) <= 2 or labels[-1].isdigit():
+        return host
+    if len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_SUFFIXES:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+def domain_of(url):
+    """Return the registrable domain of a URL"""
+    return registered_domain(host_of(url))
+
+
+def normalize_url(url):
+    """Lowercase scheme and host, drop default ports and fragments"""
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower().rstrip('.')
+    try:
+        host = host.encode('idna').decode('ascii')
+    except UnicodeError:
+        pass
+    netloc = host if port is None or port == DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+    if parts.username:
+        netloc = f"{parts.username}{':' + parts.password if parts.password else ''}@{netloc}"
+    return urlunsplit((scheme, netloc, parts.path or '/', parts.query, ''))
+
+
+def is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url):
+    """normalize_url plus tracking parameters removed and the rest in a stable order"""
+    url = normalize_url(url)
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    pairs = [pair for pair in parts.query.split('&')
+             if pair and not is_tracking_param(pair.split('=', 1)[0])]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '&'.join(sorted(pairs)), ''))
+
+
+def url_key(url):
+    """Identity of a page regardless of http/https and a leading www."""
+    parts = urlsplit(canonicalize_url(url))
+    netloc = parts.netloc[4:] if parts.netloc.startswith('www.') else parts.netloc
+    return netloc + parts.path + (f"?{parts.query}" if parts.query else '')
+
+
+def dedupe_urls(urls, seen_keys=None):
+    """Canonicalize urls and drop repeats by url_key, keeping the first occurrence"""
+    seen_keys = set() if seen_keys is None else seen_keys
+    unique = []
+    for url in urls:
+        key = url_key(url)
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        unique.append(canonicalize_url(url))
+    return unique
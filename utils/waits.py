@@ -0,0 +1,154 @@
+# utils/waits.py
+"""
+Event-driven waits built on WebDriverWait with custom expected conditions
+"""
+
+import re
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.app_config import app_config
+
+DETAIL_HEADER_SELECTORS = "h1.DUwDvf, .DUwDvf.lfPIob, div[role='main'] h1"
+
+# Map viewport segment of a place URL (/@lat,lng,zoom); it changes when the map moves, not the place
+VIEWPORT_PATTERN = re.compile(r'/@[^/]*')
+
+HEADER_TEXT_SCRIPT = """
+var nodes = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < nodes.length; i++) {
+    var text = (nodes[i].innerText || '').trim();
+    if (text && ['results', 'result', 'google maps'].indexOf(text.toLowerCase()) === -1) {
+        return text;
+    }
+}
+return '';
+"""
+
+# Counts in-flight fetch/XHR requests; installed lazily by network_idle
+NETWORK_PROBE_SCRIPT = """
+if (!window.__scrapeonNet) {
+    var net = window.__scrapeonNet = {inflight: 0};
+    var origFetch = window.fetch;
+    if (origFetch) {
+        window.fetch = function() {
+            net.inflight++;
+            return origFetch.apply(this, arguments).finally(function() { net.inflight--; });
+        };
+    }
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        net.inflight++;
+        this.addEventListener('loadend', function() { net.inflight--; });
+        return origSend.apply(this, arguments);
+    };
+}
+return [
+    window.__scrapeonNet.inflight,
+    performance.getEntriesByType('resource').length,
+    document.readyState
+];
+"""
+
+
+def current_header_text(driver, selectors=DETAIL_HEADER_SELECTORS):
+    """Return the text of the place detail header, or '' if none is shown"""
+    try:
+        return driver.execute_script(HEADER_TEXT_SCRIPT, selectors) or ''
+    except WebDriverException:
+        return ''
+
+
+class detail_header_changed:
+    """The detail header shows a place other than previous_name"""
+
+    def __init__(self, previous_name=None, selectors=DETAIL_HEADER_SELECTORS):
+        self.previous_name = previous_name
+        self.selectors = selectors
+
+    def __call__(self, driver):
+        text = current_header_text(driver, self.selectors)
+        if text and text != self.previous_name:
+            return text
+        return False
+
+
+def current_place_key(driver):
+    """Return the open place's URL without query and viewport, or '' if no place is open"""
+    try:
+        url = driver.current_url or ''
+    except WebDriverException:
+        return ''
+    if '/maps/place/' not in url:
+        return ''
+    return VIEWPORT_PATTERN.sub('', url.split('?', 1)[0])
+
+
+class place_changed:
+    """A place other than previous_key is open and its header has rendered.
+
+    Keyed by the place URL, whose data segment carries the place id, so
+    consecutive places with the same name (chain branches) are told apart.
+    """
+
+    def __init__(self, previous_key=None, selectors=DETAIL_HEADER_SELECTORS):
+        self.previous_key = previous_key
+        self.selectors = selectors
+
+    def __call__(self, driver):
+        key = current_place_key(driver)
+        if not key or key == self.previous_key:
+            return False
+        return current_header_text(driver, self.selectors) or False
+
+
+class feed_length_increased:
+    """The number of feed cards matching selector exceeds previous_count"""
+
+    def __init__(self, previous_count, selector="[data-result-index], .hfpxzc"):
+        self.previous_count = previous_count
+        self.selector = selector
+
+    def __call__(self, driver):
+        count = driver.execute_script("return document.querySelectorAll(arguments[0]).length", self.selector)
+        if count > self.previous_count:
+            return count
+        return False
+
+
+class network_idle:
+    """No fetch/XHR in flight and no new resources for idle_time seconds"""
+
+    def __init__(self, idle_time=0.5):
+        self.idle_time = idle_time
+        self._last_state = None
+        self._quiet_since = None
+
+    def __call__(self, driver):
+        inflight, resources, ready_state = driver.execute_script(NETWORK_PROBE_SCRIPT)
+        now = time.monotonic()
+        state = (inflight, resources)
+
+        if inflight > 0 or ready_state != 'complete' or state != self._last_state:
+            self._last_state = state
+            self._quiet_since = now if inflight == 0 and ready_state == 'complete' else None
+            return False
+
+        if self._quiet_since is None:
+            self._quiet_since = now
+        return now - self._quiet_since >= self.idle_time
+
+
+def wait_for(driver, condition, timeout, poll_frequency=0.1):
+    """Wait until condition holds or timeout expires; returns None on timeout"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(condition)
+    except TimeoutException:
+        return None
+
+
+def wait_timeout(name):
+    """Upper bound in seconds for the named wait"""
+    return app_config.WAIT_TIMEOUTS.get(name, app_config.DEFAULT_TIMEOUT)